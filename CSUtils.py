@@ -1,69 +1,145 @@
 import time
 import os
-import sys
-import subprocess
-import tty
+import concurrent.futures
 from tenacity import retry, wait_fixed, stop_after_attempt
-import timeout_decorator
 from chipshouter import ChipSHOUTER
-from .USBUtils import find_usb_port_by_tty, find_tty_by_id
+from .USBUtils import find_usb_port_by_tty, find_tty_by_id, get_hub_controller
 
 
 class ChipShouter:
     def __init__(self, tty_or_id="NewAE_ChipSHOUTER_Serial"):
         self._tty_or_id=tty_or_id
+        self._temps_cache = None # (timestamp, threshold, result) of last temps_too_high() call
+        self._executor = None # background thread for power_cycle_usb(wait=False)
+        self._power_cycle_future = None
 
+        self._find_tty()
+        self._discover_usb_topology()
+
+        # Initialize ChipShouter
+        self._pulsegen_config = None # last configuration written by configure_pulsegen()
+        self._open_serial()
+        if self._needs_reset():
+            self.reset() # takes about 5s
+        print("Chipshouter connected!")
+
+    def _needs_reset(self):
+        """
+        Check if the ChipShouter has to be reset before use.
+        A freshly booted device (absent_temp, mute have default values) or one with faults needs a reset.
+        """
+        try:
+            return bool(self.cs.faults_current) or self.cs.absent_temp != 60 or not self.cs.mute
+        except Exception:
+            return True
+
+    def _find_tty(self):
         # Find ChipShouter tty
-        if tty_or_id.startswith("/dev/tty"):
+        if self._tty_or_id.startswith("/dev/tty"):
             # If tty_or_id starts with /dev/tty check if the specified device exists
-            if os.path.exists(tty_or_id):
-                self._tty = tty_or_id
+            if os.path.exists(self._tty_or_id):
+                self._tty = self._tty_or_id
             else:
-                raise FileNotFoundError(f"TTY device '{tty_or_id}' not found.")
+                raise FileNotFoundError(f"TTY device '{self._tty_or_id}' not found.")
         else:
             # Else try to find tty by substring matching serial_ids (from /dev/serial/by-id)
             try:
-                self._tty = find_tty_by_id(tty_or_id)
+                self._tty = find_tty_by_id(self._tty_or_id)
             except Exception as e:
                 raise FileNotFoundError(f"ChipShouter USB: {str(e)}")
 
+    def _discover_usb_topology(self):
         # Find ChipShouter USB hub_path and hub_port_num (used for power cycling with uhubctl)
+        # The hub port does not change when the ChipShouter is power cycled, so this only runs once.
+        self._hub_path, self._hub_port_num = None, None
         try:
             self._hub_path, self._hub_port_num = find_usb_port_by_tty(self._tty)
         except Exception as e:
             print(f"ChipShouter: {str(e)}")
             print("ChipShouter: USB Power cycling unavailable!")
 
-        # Initialize ChipShouter
+    def _open_serial(self):
+        # tty name may change after re-enumeration (lookup is cached while /dev/serial/by-id is unchanged)
+        self._find_tty()
         self.cs = ChipSHOUTER(self._tty)
-        self.reset() # takes about 5s
-        print("Chipshouter connected!")
 
     def disconnect(self):
+        if self._executor is not None:
+            self.wait_for_power_cycle()
+            self._executor.shutdown(wait=True)
+            self._executor = None
         self.disarm()
         self.cs.disconnect()
         del self.cs
 
-    def power_cycle_usb(self):
-        if self._hub_path and self._hub_port_num:
-            self._power_cycle_usb()
-        else:
+    def power_cycle_usb(self, wait=True):
+        """
+        Power cycle the ChipShouter USB port and reconnect.
+
+        Args:
+            wait (bool, optional): If False, power cycling runs in a background thread so other work
+                (e.g. resetting the target) can be done in the meantime. wait_for_power_cycle()
+                has to be called before the ChipShouter is used again. Defaults to True.
+
+        Returns:
+            concurrent.futures.Future: Future of the background power cycle, None if wait is True
+        """
+        if not (self._hub_path and self._hub_port_num):
             raise Exception("ChipShouter: USB Power cycling is unavailable (check if your hub supports it with uhubctl)")
 
-    @retry(wait=wait_fixed(10), stop=stop_after_attempt(3))
-    def _power_cycle_usb(self):
-        print("Power cycling ChipShouter USB Port")
-        subprocess.run(
-            ["uhubctl", "-l", self._hub_path, "-p", self._hub_port_num, "-a", "cycle"],
-            stdout=subprocess.DEVNULL
-        )
-        self.__init__(self._tty_or_id)
+        # A power cycle still running in the background would reassign self.cs concurrently
+        self.wait_for_power_cycle()
+        if wait:
+            self._power_cycle_usb()
+            return None
+
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._power_cycle_future = self._executor.submit(self._power_cycle_usb)
+        return self._power_cycle_future
+
+    def wait_for_power_cycle(self, timeout=None):
+        """
+        Block until a power cycle started with power_cycle_usb(wait=False) is finished.
+        Exceptions raised while power cycling are re-raised here.
+
+        Args:
+            timeout (float, optional): Time to wait in seconds, None waits until it is finished.
+                On a timeout the power cycle keeps running and can be waited for again. Defaults to None.
+        """
+        future = self._power_cycle_future
+        if future is None:
+            return
+        try:
+            future.result(timeout=timeout)
+        finally:
+            if future.done():
+                self._power_cycle_future = None
+
+    def _power_cycle_usb(self, attempts=3, wait=10):
+        for attempt in range(1, attempts + 1):
+            try:
+                print("Power cycling ChipShouter USB Port")
+                get_hub_controller().power_cycle(self._hub_path, self._hub_port_num)
+                self._open_serial()
+                if self._needs_reset():
+                    self.reset()
+                print("Chipshouter reconnected!")
+                return
+            except Exception as e:
+                if attempt == attempts:
+                    raise
+                print(f"ChipShouter: Power cycling failed ({str(e)}), retrying in {wait}s...")
+                time.sleep(wait)
 
     def reset(self):
         # Reset ChipShouter
+        self._pulsegen_config = None # reset restores the default pulse generator configuration
         self.cs.reset = True
-        # Wait till ChipShouter is reset and ready
-        time.sleep(0.5)
+        # The chipshouter library already waits for the reboot (cmd_reset() sleeps 5s and checks that the
+        # device answers again), make sure it reports a regular state before configuring it
+        if not self._adaptive_wait(self._is_ready, timeout=2):
+            raise RuntimeError("ChipShouter: not ready after reset!")
 
         self.cs.absent_temp = 60
         self.cs.mute = True
@@ -82,7 +158,7 @@ class ChipShouter:
         overtemp_clear_try = 1
         overtemp_clear_max_tries = 30
         while "fault_overtemp" in self.cs.faults_current and overtemp_clear_try < overtemp_clear_max_tries:
-            print("Trying to clear ChiShouter overtemp fault (try {overtemp_clear_try}/{overtemp_clear_max_tries})...")
+            print(f"Trying to clear ChipShouter overtemp fault (try {overtemp_clear_try}/{overtemp_clear_max_tries})...")
             self.cs.faults_current = 0
             time.sleep(10)
             overtemp_clear_try += 1
@@ -94,19 +170,70 @@ class ChipShouter:
         if current:
             raise RuntimeError(f"Failed to clear ChipSHOUTER faults: {current}!")
 
-    def temps_too_high(self, threshold=65):
-        return any(temp > threshold for temp in [
-            self.cs.temperature_diode,
-            self.cs.temperature_mosfet,
-            self.cs.temperature_xformer,
-        ])
+    def temps_too_high(self, threshold=65, max_age=1.0):
+        """
+        Check if any ChipShouter temperature sensor exceeds threshold (in °C).
+
+        Every sensor read is a serial round-trip, so sensors are read lazily (stops at the
+        first one above threshold, transformer first since it usually runs hottest) and
+        the result is reused for max_age seconds.
+        """
+        now = time.monotonic()
+        cached = self._temps_cache
+        if cached and cached[1] == threshold and now - cached[0] < max_age:
+            return cached[2]
+
+        sensors = (
+            lambda: self.cs.temperature_xformer,
+            lambda: self.cs.temperature_mosfet,
+            lambda: self.cs.temperature_diode,
+        )
+        too_high = any(read() > threshold for read in sensors)
+
+        self._temps_cache = (now, threshold, too_high)
+        return too_high
+
+    def _adaptive_wait(self, predicate, timeout):
+        """
+        Wait until predicate() returns True or timeout (in seconds) occurs.
+
+        Polls without sleeping for the first iterations (every poll is a serial round-trip
+        to the ChipShouter, which already throttles the loop), then sleeps with an
+        exponentially increasing interval (1 ms up to 100 ms) bounded by the deadline.
+
+        Returns:
+            bool: True if predicate() became True, False on timeout.
+        """
+        deadline = time.monotonic() + timeout
+
+        # Fast path: most state transitions finish within a few polls
+        for _ in range(200):
+            if predicate():
+                return True
+            if time.monotonic() >= deadline:
+                return False
+
+        # Slow path: back off exponentially
+        delay = 0.001
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return predicate()
+            time.sleep(min(delay, remaining))
+            if predicate():
+                return True
+            delay = min(delay * 2, 0.1)
+
+    def _is_ready(self):
+        try:
+            return self.cs.state in ("disarmed", "armed", "idle")
+        except Exception:
+            # ChipShouter does not respond while resetting
+            return False
 
     def _wait_for_safe(self, timeout=1):
         """Wait until trigger_safe becomes True or timeout (in seconds) occurs."""
-        deadline = time.time() + timeout
-        while not self.cs.trigger_safe and time.time() < deadline:
-            time.sleep(0.1)
-        return self.cs.trigger_safe
+        return self._adaptive_wait(lambda: self.cs.trigger_safe, timeout)
 
     class ArmingTimeoutError(TimeoutError):
         def __init__(self, message="ChipShouter: Arming failed due to timeout!"):
@@ -116,8 +243,8 @@ class ChipShouter:
     #     wait=wait_fixed(1),
     #     stop=stop_after_attempt(3)
     # )
-    @timeout_decorator.timeout(10, timeout_exception=ArmingTimeoutError)
-    def arm(self):
+    def arm(self, timeout=10):
+        deadline = time.monotonic() + timeout
         state = self.cs.state
         if state == "armed":
             # Even if already armed, set armed variable again
@@ -135,12 +262,15 @@ class ChipShouter:
             raise RuntimeError("ChipShouter has faults!")
 
         # wait till CS is armed
-        print("arming.", end="")
-        while self.cs.state != "armed":
-            time.sleep(0.1)
-            print(".", end="")
-            sys.stdout.flush()
-        print(f"{self.cs.state}")
+        polls = 0
+        def is_armed():
+            nonlocal polls
+            polls += 1
+            return self.cs.state == "armed"
+
+        if not self._adaptive_wait(is_armed, deadline - time.monotonic()):
+            raise self.ArmingTimeoutError()
+        print(f"ChipShouter armed after {polls} polls")
         # Set actual desired voltage after arming
         self.cs.voltage = voltage_setpoint
 
@@ -155,10 +285,14 @@ class ChipShouter:
         assert repeat in range(1, 10001), "Chipshouter pulse.repeat has to be between 1 and 10000!"
         assert width in range(80, 961), "Chipshouter pulse.width has to be between 80 and 960 ns!"
 
+        # Every write is a separate serial transaction, only write values that changed since the last call
+        if self._pulsegen_config == (deadtime, repeat, width):
+            return
         self.cs.emode = False # configure enable pin, to trigger a pulse
         self.cs.pulse.deadtime = deadtime
         self.cs.pulse.repeat = repeat
         self.cs.pulse.width = width
+        self._pulsegen_config = (deadtime, repeat, width)
 
     @property
     def voltage(self):
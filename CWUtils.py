@@ -1,25 +1,32 @@
 import time
+import numpy as np
 import chipwhisperer as cw
-from tenacity import retry, wait_fixed, stop_after_attempt
-import timeout_decorator
-import subprocess
-from .USBUtils import find_usb_port_by_tty, find_tty_by_id
+from .USBUtils import find_usb_port_by_tty, find_tty_by_id, get_hub_controller
 
 class ChipWhisperer:
     # TODO: handle multiple connected ChipWhisperers (pass serial number and get usb hub port from that)
     def __init__(self, target_type=cw.targets.SimpleSerial):
         self._target_type=target_type
+        self._trace_buf = None
+        self._connect()
+        self._discover_usb_topology()
+
+    def _connect(self):
         self.scope = cw.scope()
         self.scope.default_setup()
         try:
-            self.target = cw.target(self.scope, target_type)
+            self.target = cw.target(self.scope, self._target_type)
         except:
             print("INFO: Caught exception on reconnecting to target - attempting to reconnect to self.scope first.")
             print("INFO: This is a work-around when USB has died without Python knowing. Ignore errors above this line.")
             self.scope = cw.scope()
-            self.target = cw.target(self.scope, target_type)
+            self.scope.default_setup() # configure_scope() relies on default_setup() having run on connect
+            self.target = cw.target(self.scope, self._target_type)
 
+    def _discover_usb_topology(self):
         # Find ChipWhisperer USB hub_path and hub_port_num (used for power cycling with uhubctl)
+        # The hub port does not change when the ChipWhisperer is power cycled, so this only runs once.
+        self._hub_path, self._hub_port_num = None, None
         try:
             # TODO: handle multiple ChipWhipserers
             self.chipwhisperer_tty = find_tty_by_id("ChipWhisperer_Lite")
@@ -29,15 +36,39 @@ class ChipWhisperer:
             print("ChipWhisperer: USB Power cycling unavailable!")
 
     def configure_scope(self, samples:int, offset:int, decimate:int, timeout:float):
-        self.scope.default_setup()
-        self.scope.adc.decimate = 1
-        self.scope.adc.timeout = 5
-        self.scope.adc.samples = 24400 # max = 24573
-        self.scope.adc.offset = 25000 # number of samples to be skipped (not recorded) after trigger (32 bit uint)
+        # default_setup() already ran on connect, only the capture parameters are set here
+        self.scope.adc.decimate = decimate
+        self.scope.adc.timeout = timeout
+        self.scope.adc.samples = samples # max = 24573
+        self.scope.adc.offset = offset # number of samples to be skipped (not recorded) after trigger (32 bit uint)
+
+        # Trace buffer reused by capture_trace()
+        self._trace_buf = np.empty(samples, dtype=np.int16)
 
         print("INFO: Found ChipWhisperer😍")
         print(f"sample rate = adc_frequency({self.scope.clock.adc_freq}) * multiplier({self.scope.clock.adc_mul}) = {self.scope.clock.adc_freq * self.scope.clock.adc_mul}")
 
+    def capture_trace(self) -> np.ndarray:
+        """
+        Get the last captured trace (raw ADC values) in a buffer allocated once by configure_scope().
+
+        The returned array is a view into that buffer and is overwritten by the next call,
+        copy it if it has to be kept.
+
+        Raises:
+            RuntimeError: If configure_scope() was not called before.
+
+        Returns:
+            np.ndarray: View of the trace buffer (int16)
+        """
+        if self._trace_buf is None:
+            raise RuntimeError("ChipWhisperer: configure_scope() has to be called before capture_trace()")
+
+        trace = self.scope.get_last_trace(as_int=True)
+        num_samples = min(len(trace), len(self._trace_buf))
+        np.copyto(self._trace_buf[:num_samples], trace[:num_samples], casting="unsafe")
+        return self._trace_buf[:num_samples]
+
     def reset_target(self):
         self.scope.io.nrst = 'low'
         time.sleep(0.2)
@@ -50,20 +81,19 @@ class ChipWhisperer:
         else:
             raise Exception("ChipWhisperer: USB Power cycling is unavailable (check if your hub supports it with uhubctl)")
 
-    @retry(wait=wait_fixed(10), stop=stop_after_attempt(3))
-    def _power_cycle_usb(self):
-        print("Power cycling ChipWhisperer USB Port")
-        subprocess.run(
-            ["uhubctl", "-l", self._hub_path, "-p", self._hub_port_num, "-a", "off"],
-            stdout=subprocess.DEVNULL
-        )
-        time.sleep(5)
-        subprocess.run(
-            ["uhubctl", "-l", self._hub_path, "-p", self._hub_port_num, "-a", "on"],
-            stdout=subprocess.DEVNULL
-        )
-        time.sleep(5)
-        self.__init__(self._target_type)
+    def _power_cycle_usb(self, attempts=3, wait=10):
+        for attempt in range(1, attempts + 1):
+            try:
+                print("Power cycling ChipWhisperer USB Port")
+                get_hub_controller().power_cycle(self._hub_path, self._hub_port_num, off_time=5)
+                time.sleep(5)
+                self._connect()
+                return
+            except Exception as e:
+                if attempt == attempts:
+                    raise
+                print(f"ChipWhisperer: Power cycling failed ({str(e)}), retrying in {wait}s...")
+                time.sleep(wait)
 
     def flash(self, binary_path):
         prog = cw.programmers.STM32FProgrammer
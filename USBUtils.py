@@ -1,5 +1,19 @@
 import os
+import re
 import subprocess
+import time
+
+# Opened once and shared by all uhubctl calls (subprocess.DEVNULL opens /dev/null on every call)
+_DEVNULL = open(os.devnull, "wb")
+
+# Name of a USB device directory in sysfs (<bus>-<port>[.<port>...], e.g. 1-1.2)
+_USB_DEVICE_NAME_RE = re.compile(r"\d+-\d+(\.\d+)*")
+
+# Cache for find_usb_port_by_dev_path(): (dev_path, st_rdev) -> (hub_path, hub_port_num)
+_USB_PORT_CACHE: dict[tuple[str, int], tuple[str, str]] = {}
+
+# Cache for find_tty_by_id(): (st_mtime_ns of /dev/serial/by-id, serial_id) -> tty path
+_TTY_CACHE: dict[tuple[int, str], str] = {}
 
 def find_usb_port_by_dev_path(dev_path : str) -> tuple[str, str]:
     """
@@ -16,20 +30,39 @@ def find_usb_port_by_dev_path(dev_path : str) -> tuple[str, str]:
         tuple[str, str]: (hub_path, hub_port_num)
     """
 
-    # Get sysfs path using udevadm
-    try:
-        usb_rel_path = subprocess.check_output(
-            ["udevadm", "info", "-q", "path", "-n", dev_path],
-            text=True
-        ).strip()
-    except subprocess.CalledProcessError:
-        raise RuntimeError(
-            f"Could not get sysfs path for {dev_path}\n"
-        )
+    # Device number identifies the device node, so replugged devices don't hit stale entries
+    key = (dev_path, os.stat(dev_path).st_rdev)
+    if key in _USB_PORT_CACHE:
+        return _USB_PORT_CACHE[key]
 
-    # Walk up until we find a directory with idVendor
-    device_dir = "/sys" + usb_rel_path
-    while not os.path.exists(os.path.join(device_dir, "idVendor")):
+    tty_class_path = os.path.join("/sys/class/tty", os.path.basename(dev_path))
+    if dev_path.startswith("/dev/tty") and os.path.islink(tty_class_path):
+        # Get sysfs path directly from the tty class symlink
+        device_dir = os.path.normpath(
+            os.path.join("/sys/class/tty", os.readlink(tty_class_path))
+        )
+    else:
+        # Get sysfs path using udevadm
+        try:
+            usb_rel_path = subprocess.check_output(
+                ["udevadm", "info", "-q", "path", "-n", dev_path],
+                text=True
+            ).strip()
+        except subprocess.CalledProcessError:
+            raise RuntimeError(
+                f"Could not get sysfs path for {dev_path}\n"
+            )
+        device_dir = "/sys" + usb_rel_path
+
+    # Strip path components until the USB device directory is reached (no syscalls needed)
+    parts = device_dir.split("/")
+    while parts and not _USB_DEVICE_NAME_RE.fullmatch(parts[-1]):
+        parts.pop()
+    if parts and os.path.isfile(os.path.join("/".join(parts), "idVendor")):
+        device_dir = "/".join(parts)
+
+    # Fallback: walk up until we find a directory with idVendor
+    while not os.path.isfile(os.path.join(device_dir, "idVendor")):
         new_dir = os.path.dirname(device_dir)
         if new_dir == device_dir:
             raise ValueError(f"Could not find idVendor for {dev_path}")
@@ -56,6 +89,7 @@ def find_usb_port_by_dev_path(dev_path : str) -> tuple[str, str]:
             "(expected <hub>-<port> or <hub>-<sub>.<port>)"
         )
 
+    _USB_PORT_CACHE[key] = (hub_path, hub_port_num)
     return hub_path, hub_port_num
 
 def find_usb_port_by_busdev(bus_num : int, dev_num : int) -> tuple[str, str]:
@@ -123,15 +157,26 @@ def find_tty_by_id(serial_id : str) -> str:
     """
 
     by_id_path = "/dev/serial/by-id"
-    if not os.path.exists(by_id_path):
+    try:
+        st = os.stat(by_id_path)
+    except FileNotFoundError:
         raise FileNotFoundError("Serial ID directory '/dev/serial/by-id/' does not exist.")
 
+    # Directory mtime changes whenever a device is plugged/unplugged -> cache entry becomes stale
+    key = (st.st_mtime_ns, serial_id)
+    if key in _TTY_CACHE:
+        return _TTY_CACHE[key]
+
     # Manual pattern matching
     matches = []
-    for name in os.listdir(by_id_path):
-        if serial_id in name:  # substring match
-            full_path = os.path.join(by_id_path, name)
-            matches.append(os.path.realpath(full_path))
+    with os.scandir(by_id_path) as entries:
+        for entry in entries:
+            if serial_id in entry.name and entry.is_symlink():  # substring match
+                # Entries are single-level symlinks (e.g. ../../ttyUSB0), no full realpath() resolution needed
+                target = os.readlink(entry.path)
+                if not os.path.isabs(target):
+                    target = os.path.normpath(os.path.join(by_id_path, target))
+                matches.append(target)
 
     if not matches:
         raise FileNotFoundError(
@@ -142,4 +187,124 @@ def find_tty_by_id(serial_id : str) -> str:
             f"Multiple devices match serial ID '{serial_id}' ({', '.join(matches)}).  Please pass the tty device or exact serial id. "
         )
 
-    return matches[0]
\ No newline at end of file
+    _TTY_CACHE[key] = matches[0]
+    return matches[0]
+
+class HubController:
+    """
+    Switch the power of individual USB hub ports (like `uhubctl -a off/on/cycle`).
+
+    The hub port feature requests are sent directly via libusb (`libusb1` package) and the
+    hub devices are looked up once and kept open, which avoids the full USB enumeration that
+    uhubctl performs on every call. Like uhubctl, the USB3 companion hub (the USB3 part of a
+    hub, same port path on another bus) is switched as well. Falls back to calling uhubctl
+    when `libusb1` is not installed, for root hubs, or when the hub cannot be accessed.
+
+    Hubs are addressed the same way as with uhubctl (see `find_usb_port_by_tty()`):
+        hub_path (str): `<bus>` for root hubs or `<bus>-<port>[.<port>...]`, e.g. "1-1.2"
+        port (str | int): Port number on that hub
+    """
+    # USB 2.0 hub class requests (USB 2.0 spec, chapter 11.24)
+    _REQUEST_TYPE_PORT = 0x23 # host-to-device | class | other (port)
+    _REQUEST_CLEAR_FEATURE = 0x01
+    _REQUEST_SET_FEATURE = 0x03
+    _FEATURE_PORT_POWER = 8
+    _CLASS_HUB = 9
+
+    def __init__(self):
+        try:
+            import usb1
+        except ImportError:
+            self._context = None
+        else:
+            self._context = usb1.USBContext()
+            self._context.open()
+
+        self._hub_handles = {} # hub_path -> open libusb device handles (hub and USB3 companion hubs)
+
+    def _get_hub_handles(self, hub_path: str) -> list:
+        """
+        Open the hub and its USB3 companion hubs.
+        A USB3 hub shows up as a USB2 and a USB3 hub with the same port path on different buses,
+        port power has to be switched on both (uhubctl does the same).
+        """
+        if hub_path in self._hub_handles:
+            return self._hub_handles[hub_path]
+
+        bus, _, ports = hub_path.partition("-")
+        bus = int(bus)
+        ports = tuple(int(p) for p in ports.split("."))
+
+        hub = None
+        candidates = []
+        for device in self._context.getDeviceIterator(skip_on_error=True):
+            if device.getDeviceClass() != self._CLASS_HUB or tuple(device.getPortNumberList()) != ports:
+                continue
+            if device.getBusNumber() == bus:
+                hub = device
+            else:
+                candidates.append(device)
+
+        if hub is None:
+            raise FileNotFoundError(f"USB hub `{hub_path}` not found")
+
+        companions = [device for device in candidates if device.getVendorID() == hub.getVendorID()]
+        handles = [device.open() for device in [hub] + companions]
+        self._hub_handles[hub_path] = handles
+        return handles
+
+    def set_port_power(self, hub_path: str, port, on: bool):
+        """
+        Switch power of a hub port on or off.
+
+        Args:
+            hub_path (str): Hub location (see class docstring)
+            port (str | int): Port number on the hub
+            on (bool): True to power the port on, False to power it off
+        """
+        # Root hubs (hub_path without ports) can't be matched with their companion by port path, uhubctl handles them
+        if self._context is not None and "-" in hub_path:
+            try:
+                for handle in self._get_hub_handles(hub_path):
+                    handle.controlWrite(
+                        self._REQUEST_TYPE_PORT,
+                        self._REQUEST_SET_FEATURE if on else self._REQUEST_CLEAR_FEATURE,
+                        self._FEATURE_PORT_POWER,
+                        int(port),
+                        b"",
+                    )
+                return
+            except Exception as e:
+                # Drop possibly stale handles and fall back to uhubctl
+                self._hub_handles.pop(hub_path, None)
+                print(f"HubController: libusb port power switching failed ({str(e)}), using uhubctl")
+
+        subprocess.run(
+            ["uhubctl", "-l", hub_path, "-p", str(port), "-a", "on" if on else "off"],
+            stdout=_DEVNULL
+        )
+
+    def power_cycle(self, hub_path: str, port, off_time: float = 2):
+        """
+        Power a hub port off, wait off_time seconds and power it on again.
+
+        Args:
+            hub_path (str): Hub location (see class docstring)
+            port (str | int): Port number on the hub
+            off_time (float, optional): Time in seconds the port stays off. Defaults to 2 (same as uhubctl).
+        """
+        self.set_port_power(hub_path, port, False)
+        time.sleep(off_time)
+        self.set_port_power(hub_path, port, True)
+
+
+_hub_controller = None
+
+def get_hub_controller() -> HubController:
+    """
+    Get the HubController instance shared by all devices (created on first use).
+    """
+    global _hub_controller
+    if _hub_controller is None:
+        _hub_controller = HubController()
+    return _hub_controller
@@ -1,16 +1,23 @@
 
+import sys
 from dataclasses import dataclass
-from typing import List, Literal, Type, Union
-import ctypes
+import numpy as np
+from typing import List
 from .simpleserial.simpleserial import TargetSerial
 
 class SimpleSerialPacket:
-    def __init__(self, command, description, externalHandler=None):
-        self.command = TargetSerial.type_convert_cmd(command)
-        self.description = description
+    __slots__ = ("command", "description", "_external_handler")
+
+    _CMD_CACHE = {} # command (as passed to constructor) -> converted command byte
 
-        if externalHandler:
-            self.handler = externalHandler
+    def __init__(self, command, description, externalHandler=None):
+        converted = self._CMD_CACHE.get(command)
+        if converted is None:
+            converted = TargetSerial.type_convert_cmd(command)
+            self._CMD_CACHE[command] = converted
+        self.command = converted
+        self.description = sys.intern(description)
+        self._external_handler = externalHandler
 
     def handler(self, packetSelf, profilerSelf, data=None):
         """
@@ -30,11 +37,14 @@ class SimpleSerialPacket:
                                                             Valid types for result_category: dict, str, int, list
         """
 
+        if self._external_handler is not None:
+            return self._external_handler(packetSelf, profilerSelf, data)
+
         raise RuntimeError(
             f"SimpleSerialPacket {self.command}: no handler defined"
         )
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GlitchConfig:
     probe: str
     voltage: int
@@ -49,7 +59,7 @@ class GlitchConfig:
     osc_measured_pulse_voltage: float = 0 # (V), measured with oscilloscope on 20:1 port of ChipShouter
     osc_measured_pulse_width: float = 0   # (ns), measured with oscilloscope on 20:1 port of ChipShouter
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TargetConfig:
     # TODO: future generalizations
     # target_type: Literal["chipwhisperer"] # implement "standalone" target type, add serial number to chipwhisperer
@@ -61,16 +71,29 @@ class TargetConfig:
     firmware_build_command: List[str] # command + args (e.g. ["make", "memcpy"])
     firmware_path: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Point:
     x: float
     y: float
     z: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MovementConfig:
     point_1: Point
     point_2: Point
     step_x: float
     step_y: float
 
+    def grid(self) -> np.ndarray:
+        """
+        Rasterize the rectangle spanned by point_1 and point_2 with step_x, step_y.
+        Z axis stays fixed at the value from point_1.
+
+        Returns:
+            np.ndarray: Positions [x, y, z] as (N, 3) array (x changes slowest)
+        """
+        xs = np.arange(self.point_1.x, self.point_2.x + self.step_x / 2, self.step_x)
+        ys = np.arange(self.point_1.y, self.point_2.y + self.step_y / 2, self.step_y)
+        gx, gy = np.meshgrid(xs, ys, indexing="ij")
+        return np.stack([gx.ravel(), gy.ravel(), np.full(gx.size, self.point_1.z)], axis=1)
+
@@ -6,10 +6,12 @@ import signal
 import subprocess
 import traceback
 import time
-from dataclasses import dataclass, asdict
-import json
-import copy
+import queue
+import threading
+from dataclasses import dataclass, fields
 
+import orjson
+import numpy as np
 from tenacity import RetryError
 
 # local imports
@@ -27,6 +29,13 @@ from .lib.emf_table.table import xyzTable
 # - Add start and end timestamp to log file
 # - Documentation
 
+def _default_serializer(obj):
+    # bytes/bytearray (e.g. parsed packet buffers) are stored as uppercase hex strings
+    if isinstance(obj, (bytes, bytearray)):
+        return bytes(obj).hex().upper()
+    print(f"ERROR: Serialization failed for: {obj}")
+    return "SERIALIZATION_FAILED"
+
 class ResetTimeoutError(TimeoutError):
     def __init__(self, message="Failed to reset target!"):
         super().__init__(message)
@@ -50,7 +59,19 @@ class CSProfiler:
         self.target_config = target_config
         self.positions = positions
         self.num_positions = len(self.positions)
+        self._positions_arr = np.asarray(self.positions, dtype=np.float64).reshape(-1, 3) # (N, 3) array of [x, y, z]
         self.glitch_configs = glitch_configs
+        # GlitchConfigs are frozen, so their dict representation (for store_results()) is built only once
+        self._glitch_config_dicts = [
+            {field.name: getattr(cfg, field.name) for field in fields(cfg)}
+            for cfg in self.glitch_configs
+        ]
+        self._last_execution_end = 0.0 # time.monotonic() when the last test_execution() finished
+        self._event_log = None # results/results_<counter>.ndjson, one line per execution (see open_event_log())
+        self._results_counter = None # <counter> of the event log, store_results() uses the same one
+        self._event_queue = None # events to be written by the event log writer thread
+        self._event_writer = None
+        self.progress_every = 100 # print progress every n executions (and after the last execution of a glitch_config)
 
         if simpleserial_config:
             self.simpleserial_config = simpleserial_config
@@ -71,14 +92,15 @@ class CSProfiler:
             "hard_bricked": "Hard reset failed",
             "skipped": "Skipped"
         }
-        self._results = [
-            {
-                f"num_{key}": [0] * self.num_positions
-                for key in self.result_types
-            } for _ in self.glitch_configs
-        ]
-
+        # Result type -> row index in result_counters (integer indexing instead of "num_<key>" dict lookups per execution)
+        self._cat_id = {key: i for i, key in enumerate(self.result_types)}
         self.valid_commands = [ss_packet.command for ss_packet in self.simpleserial_config]
+        # Command byte -> SimpleSerialPacket (O(1) lookup in send_packet() and handlePacket())
+        self._packet_by_cmd = {ss_packet.command: ss_packet for ss_packet in self.simpleserial_config}
+        # Command as passed to send_packet() (byte or single character) -> command byte, built at registration
+        self._cmd_lookup = {}
+        for ss_packet in self.simpleserial_config:
+            self._register_cmd_lookup(ss_packet.command)
 
     def addResultType(self, key: str, label: str):
         """
@@ -101,8 +123,8 @@ class CSProfiler:
         Notes
         -----
         - Successfully added result types are tracked in `self.result_types`.
-        - A new `num_<key>` entry will also be added to all `self._results` dictionaries
-        (initialized with zeros, sized to `self.num_positions`).
+        - If a campaign already created `self.result_counters`, a new row of counters (initialized
+        with zeros) is appended for every glitch_config. It is stored as `num_<key>` in the results.
         """
         if not isinstance(key, str) or not isinstance(label, str):
             raise ValueError("addResultType: Both key and label must be strings.")
@@ -114,10 +136,44 @@ class CSProfiler:
 
         # Add to result_types mapping
         self.result_types[key] = label
+        self._cat_id[key] = len(self._cat_id)
 
         # Add corresponding counters to existing results
-        for res in self._results:
-            res[f"num_{key}"] = [0] * self.num_positions
+        counters = getattr(self, "result_counters", None)
+        if counters is not None:
+            self.result_counters = np.concatenate(
+                (counters, np.zeros((counters.shape[0], 1, counters.shape[2]), dtype=np.int64)),
+                axis=1
+            )
+            # Views in self.results still point to the old array
+            self._link_counters(self.results, self.result_counters)
+
+    def _fresh_results(self):
+        """
+        Create empty results.
+
+        Returns:
+            tuple[list[dict], np.ndarray]: One dict per glitch_config (extradata per result type and `num_<key>`
+                counter views, see _link_counters()) and the result counters indexed by
+                [config_index, category_id, position_index] (category_id from `self._cat_id`)
+        """
+        results = [{} for _ in self.glitch_configs]
+        result_counters = np.zeros(
+            (len(self.glitch_configs), len(self._cat_id), self.num_positions),
+            dtype=np.int64
+        )
+        self._link_counters(results, result_counters)
+        return results, result_counters
+
+    def _link_counters(self, results, result_counters):
+        """
+        Store the counters of every result type as `num_<key>` in the results dict of each glitch_config.
+        The entries are views into result_counters (one value per position), so packet handlers can
+        still read and update e.g. `results[config_index]["num_faults"][position_index]`.
+        """
+        for config_index, config_results in enumerate(results):
+            for key, cat_id in self._cat_id.items():
+                config_results[f"num_{key}"] = result_counters[config_index, cat_id]
 
     def addSimpleSerialCommand(self, packet, overwrite=False):
         """
@@ -148,7 +204,7 @@ class CSProfiler:
         if packet.command == 0:
             raise KeyError(f"SimpleSerial command cannot be 0 since zero is the termination character.")
 
-        if packet.command in self.valid_commands:
+        if packet.command in self._packet_by_cmd:
             if not overwrite:
                 raise KeyError(
                     f"addCommand: Command '{packet.command}' already exists in valid_commands."
@@ -162,46 +218,94 @@ class CSProfiler:
         # Append to configuration and update valid commands
         self.simpleserial_config.append(packet)
         self.valid_commands.append(packet.command)
+        self._packet_by_cmd[packet.command] = packet
+        self._register_cmd_lookup(packet.command)
+
+    def _register_cmd_lookup(self, cmd: int):
+        # SimpleSerialPacket.command is always converted to int on construction
+        self._cmd_lookup[cmd] = cmd
+        self._cmd_lookup[chr(cmd)] = cmd
 
     def send_packet(self, cmd, data=None):
-        cmd = TargetSerial.type_convert_cmd(cmd)
-        if not cmd in self.valid_commands:
-            raise ValueError(f"sendPacket: Command: `{cmd}` is not a valid command, add it using addSimpleSerialCommand()")
+        cmd_int = self._cmd_lookup.get(cmd)
+        if cmd_int is None:
+            # Not registered as is (e.g. a multi character string), convert and check again
+            cmd_int = TargetSerial.type_convert_cmd(cmd)
+            if cmd_int not in self._packet_by_cmd:
+                raise ValueError(f"sendPacket: Command: `{cmd_int}` is not a valid command, add it using addSimpleSerialCommand()")
 
-        self.target_serial.send_packet(cmd, data)
+        self.target_serial.send_packet(cmd_int, data)
 
     def ctrl_c_signal_handler(self, sig, frame):
         print("STORING RESULTS BEFORE EXIT")
+        # Every execution is already in the event log, only the queued lines have to be written
+        self.close_event_log()
         self.store_results(self.results, partial=True)
         self.cs.disarm()
         sys.exit(0)
 
-    @staticmethod
-    def make_json_serializable(obj):
-        """
-        Recursively convert a Python dict to a JSON-serializable format.
+    def _next_results_counter(self, results_path):
+        # Find a unique filename (read the directory once instead of probing every candidate)
+        counter = 0
+        os.makedirs(results_path, exist_ok=True)
+        with os.scandir(results_path) as entries:
+            existing = {entry.name for entry in entries}
+        # The event log of a campaign that was killed before any results JSON was written also takes the counter
+        while (f"results_{counter}.json" in existing or f"results_{counter}_partial.json" in existing
+               or f"results_{counter}.ndjson" in existing):
+            counter += 1
+        return counter
 
-        - dict: process keys/values recursively
-        - list/tuple: process elements recursively
-        - bytes/bytearray: convert to uppercase hex string
-        - other types: returned as-is
+    def open_event_log(self, results_path="results/"):
         """
-        if isinstance(obj, dict):
-            return {k: CSProfiler.make_json_serializable(v) for k, v in obj.items()}
-        elif isinstance(obj, (list, tuple)):
-            return [CSProfiler.make_json_serializable(v) for v in obj]
-        elif isinstance(obj, (bytes, bytearray)):
-            return bytes(obj).hex().upper()
-        else:
-            return obj
+        Open the event log of the campaign (one JSON object per line for every execution).
+        It uses the same counter as the results JSON that store_results() writes afterwards.
+        Events are serialized and written by a background thread, so the campaign loop only queues them.
+        """
+        self.close_event_log()
+        counter = self._results_counter = self._next_results_counter(results_path)
+        self._event_log = open(f"{results_path}results_{counter}.ndjson", "xb") # never overwrite an existing event log
+        self._event_queue = queue.SimpleQueue() # put() is reentrant (Ctrl+c handler may interrupt a put() of the main thread)
+        self._event_writer = threading.Thread(
+            target=self._write_events, args=(self._event_log, self._event_queue), name="event-log-writer", daemon=True
+        )
+        self._event_writer.start()
+
+    def close_event_log(self):
+        """Write all queued events and close the event log."""
+        if self._event_log is not None:
+            self._event_queue.put(None)
+            self._event_writer.join()
+            self._event_log.close()
+            self._event_log = None
+            self._event_queue = None
+            self._event_writer = None
+
+    @staticmethod
+    def _write_events(event_log, event_queue):
+        # Event log writer thread, runs until close_event_log() queues None
+        while (event := event_queue.get()) is not None:
+            position_index, config_index, execution_index, result_category, extradata = event
+            try:
+                event_log.write(orjson.dumps(
+                    {"pos": position_index, "cfg": config_index, "exec": execution_index, "cat": result_category, "extra": extradata},
+                    default=_default_serializer,
+                    option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+                ))
+            except Exception as e:
+                print(f"Event log: failed to write event ({str(e)})", file=sys.stderr)
+
+    def _log_event(self, position_index, config_index, execution_index, result_category, extradata=None):
+        if self._event_log is None:
+            return
+        self._event_queue.put((position_index, config_index, execution_index, result_category, extradata))
 
     def store_results(self, results, partial=False):
-        # Find a unique filename
-        counter = 0
         results_path = "results/"
-        os.makedirs(results_path, exist_ok=True)
-        while os.path.exists(f"{results_path}results_{counter}.json") or os.path.exists(f"{results_path}results_{counter}_partial.json"):
-            counter += 1
+        # Same counter as the event log of the campaign (its .ndjson file already takes the counter)
+        counter = self._results_counter
+        if counter is None:
+            counter = self._next_results_counter(results_path)
 
         # Add info strings to the top of the results JSON
         log_json = dict()
@@ -209,34 +313,37 @@ class CSProfiler:
         # log_json.update({"Info: positions structure": "All positions [x,y,z] from the positions array are relative to the origin"}) # TODO: maybe make positions relative to origin?
 
         # Convert glitch_configs to dicts
-        glitch_config_dicts = [asdict(cfg) for cfg in self.glitch_configs]
+        glitch_config_dicts = [dict(cfg_dict) for cfg_dict in self._glitch_config_dicts]
 
-        # Add results to glitch_config dicts
+        # Add results to glitch_config dicts (counters are translated back to named "num_<key>" lists)
         for config_index, config_result in enumerate(results):
-            glitch_config_dicts[config_index].update({"results": config_result})
+            config_counters = self.result_counters[config_index]
+            named_counters = {
+                f"num_{key}": config_counters[i].tolist()
+                for key, i in self._cat_id.items()
+            }
+            extradata = {key: value for key, value in config_result.items() if not key.startswith("num_")}
+            glitch_config_dicts[config_index].update({"results": {**named_counters, **extradata}})
 
         log_json.update({"catched_errors": self.catched_errors})
         log_json.update({"positions": self.positions})
         log_json.update({"glitch_configs": glitch_config_dicts})
 
-        # Make log_json serializable
-        log_json = self.make_json_serializable(log_json)
-
         # Save log_json as file
-        def default_serializer(obj):
-            print(f"ERROR: Serialization failed for: {obj}")
-            return "SERIALIZATION_FAILED"
-
-        with open(f"{results_path}results_{counter}{'_partial' if partial else ''}.json", "w") as f:
-            json.dump(log_json, f, indent=4, default=default_serializer)
+        data = orjson.dumps(
+            log_json,
+            default=_default_serializer,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+        with open(f"{results_path}results_{counter}{'_partial' if partial else ''}.json", "wb") as f:
+            f.write(data)
 
     def configure_chipshouter(self, glitch_config:GlitchConfig):
         # Configure voltage
         self.cs.voltage = glitch_config.voltage
 
         # Using Pi Pico as pulse generator
-        with DelayController(port="/dev/ttyACM1") as dc:
-            dc.set_parameters({"offset": glitch_config.pulse_offset, "length": glitch_config.pulse_width, "spacing": glitch_config.pulse_spacing, "repeats": glitch_config.pulse_repeats})
+        self.dc.set_parameters({"offset": glitch_config.pulse_offset, "length": glitch_config.pulse_width, "spacing": glitch_config.pulse_spacing, "repeats": glitch_config.pulse_repeats})
 
         # Configure internal pulse generator
         # cs.configure_pulsegen(
@@ -247,10 +354,13 @@ class CSProfiler:
 
 
     def reset_target(self, timeout=5000, retries=3):
+        # Resolve attributes once, reset_target() runs for every position and after every fault
         reset_seq = self.target_serial._reset_sequence
+        reset = self.cw.reset_target
+        read_until = self.target_serial.read_until
         for _ in range(retries):
-            self.cw.reset_target()
-            if self.target_serial.read_until(reset_seq, timeout).endswith(reset_seq):
+            reset()
+            if read_until(reset_seq, timeout).endswith(reset_seq):
                 return 0
 
         raise ResetTimeoutError(f"Failed to reset target after {retries} tries!")
@@ -260,28 +370,21 @@ class CSProfiler:
 
     def handlePacket(self, cmd, data=None) -> tuple[str, dict]:
         # Find packet object in simpleserial_config that matches the command
-        for packet in self.simpleserial_config:
-            # Convert string commands to int if needed
-            command_byte = (
-                ord(packet.command[0]) if isinstance(packet.command, str) else packet.command
-            )
-
-            if command_byte == cmd:
-                matched_packet = packet
-                break
+        matched_packet = self._packet_by_cmd.get(cmd)
         if matched_packet is None:
             raise ValueError(f"No matching packet definition found for command: `{cmd}`")
 
-        # Calls handler function of packet if it is defined
-        if callable(matched_packet.handler):
-            result = matched_packet.handler(self, matched_packet, data)
-            if isinstance(result, tuple) and len(result) == 2:
-                result_category, extradata = result
-            elif isinstance(result, str):
-                result_category, extradata = result, None
-            else:
-                raise ValueError(f"Handler of SimpleSerialPacket {matched_packet.command} must return either a string or a (string, extradata) tuple!")
+        # Call handler function of packet (SimpleSerialPacket.handler always exists, it raises if no handler is defined)
+        result = matched_packet.handler(self, matched_packet, data)
+        if isinstance(result, str):
+            result_category, extradata = result, None
+        elif isinstance(result, tuple) and len(result) == 2:
+            result_category, extradata = result
+        else:
+            raise ValueError(f"Handler of SimpleSerialPacket {matched_packet.command} must return either a string or a (string, extradata) tuple!")
 
+        # Validation of the returned values (skipped when running with python -O)
+        if __debug__:
             # Verify that returned result_category is valid
             if result_category not in self.result_types:
                 raise ValueError(f"PacketHandler of command: `{matched_packet.command}` returned invalid result_category: `{result_category}`")
@@ -331,7 +434,8 @@ class CSProfiler:
                 - If not received in time: call self.crashHandler()
             - Return incremented execution_index, result_category, extradata (optional)
 
-        If self._test_execution is defined (by self.overwrite_test_execution()), call that function instead.
+        overwrite_test_execution() replaces this method on the instance, so the default implementation
+        below does not need to check for an overwritten function on every execution.
 
         Args:
             position_index (int):
@@ -347,60 +451,41 @@ class CSProfiler:
             tuple[int, str]: (next_execution_index, result_category)
         """
 
-        # ------------------------------ If overwritten ------------------------------ #
-
-        if hasattr(self, "_test_execution") and self._test_execution:
-            # test_execution function was overwritten call self._test_execution() instead.
-            ret = self._test_execution(self, position_index, config_index, execution_index)
-
-            # Verify the return type
-            if (isinstance(ret, tuple)):
-                if len(ret) == 2:
-                    next_execution_index, result_category = ret
-                    data = None
-                elif len(ret) == 3:
-                    next_execution_index, result_category, data  = ret
-                else:
-                    raise TypeError(f"test_execution must return a tuple (int, str, dict) or (int, str), got {type(ret)}")
-            else:
-                raise TypeError(f"test_execution must return a tuple (int, str, dict) or (int, str), got {type(ret)}")
-
-            if not isinstance(next_execution_index, int):
-                raise TypeError(f"First element (next_execution_index) must be int, got {type(next_execution_index)}")
-            if not isinstance(result_category, str):
-                raise TypeError(f"Second element (result_category) must be str, got {type(result_category)}")
-            if not (isinstance(data, dict) or data is None):
-                raise TypeError(f"Third element (extradata) must be dict or None, got {type(data)}")
-
-            return ret
-
         glitch_config = self.glitch_configs[config_index]
         next_execution_index = execution_index + 1
 
         # -------------------------- Default Implementation -------------------------- #
 
-        time.sleep(0.05) # Small delay required to prevent ChipShouter from disconnecting
+        # Local references for objects used multiple times below
+        cs = self.cs
+        target_serial = self.target_serial
+
+        # Small delay required to prevent ChipShouter from disconnecting.
+        # Time spent since the last execution (handling its result, moving the table, ...) counts towards it.
+        remaining_delay = 0.05 - (time.monotonic() - self._last_execution_end)
+        if remaining_delay > 0:
+            time.sleep(remaining_delay)
 
         # Arm ChipShouter. If it has faults, try to clear them.
         try:
-            self.cs.arm()
+            cs.arm()
         except Exception as e:
             # TODO: remove this separate handler and throw the fault into the main execution error handler
             self.catched_errors.append({"position_index": position_index, "error": str(e)})
             if str(e) == "ChipShouter has faults!":
-                self.cs.clear_faults()
+                cs.clear_faults()
                 return next_execution_index, "skipped", None
             else:
                 print(e)
                 raise e
 
         # Check ChipShouter temps
-        while self.cs.temps_too_high():
+        while cs.temps_too_high():
             print("Chipshouter Temp too high, waiting...")
             time.sleep(10)
 
         # Validate that ChipShouter is ready for trigger
-        if not self.cs.cs.trigger_safe:
+        if not cs.cs.trigger_safe:
             raise RuntimeError("ChipShouter is not ready for trigger (trigger_safe failed)!")
 
         # TODO: check CS measured voltage (prevents too fast shooting where CS cant charge quick enough)
@@ -410,19 +495,20 @@ class CSProfiler:
         self.send_packet("s")
 
         # Wait for target to acknowlege start packet
-        if self.target_serial.wait_ack("s", glitch_config.ack_timeout) != 0:
+        if target_serial.wait_ack("s", glitch_config.ack_timeout) != 0:
             # ack not received -> target bricked
             result_category, extradata = self.crashHandler()
         else:
             # Read next packet from target
             try:
-                cmd, raw_data = self.target_serial.read_packet(timeout=glitch_config.dead_timeout)
+                cmd, raw_data = target_serial.read_packet(timeout=glitch_config.dead_timeout)
             except Exception as e:
                 result_category, extradata = self.crashHandler()
             else: # if no exception was raised
                 # Handle packet (according to simpleserial_config)
                 result_category, extradata = self.handlePacket(cmd, raw_data)
 
+        self._last_execution_end = time.monotonic()
         return next_execution_index, result_category, extradata
 
     def overwrite_test_execution(self, func):
@@ -432,16 +518,52 @@ class CSProfiler:
             test_execution(self, position_index, config_index, execution_index) -> (result_category, extradata, new_execution_index)
         """
         # Check if func has correct number of arguments
-        orig_count = self.test_execution.__code__.co_argcount
+        orig_count = CSProfiler.test_execution.__code__.co_argcount
         new_count = func.__code__.co_argcount
         if orig_count != new_count:
             raise TypeError(
                 f"overwrite_test_execution: Function has wrong number of arguments."
             )
 
+        def test_execution(position_index, config_index, execution_index):
+            ret = func(self, position_index, config_index, execution_index)
+
+            # Verify the return type
+            if (isinstance(ret, tuple)):
+                if len(ret) == 2:
+                    next_execution_index, result_category = ret
+                    data = None
+                elif len(ret) == 3:
+                    next_execution_index, result_category, data  = ret
+                else:
+                    raise TypeError(f"test_execution must return a tuple (int, str, dict) or (int, str), got {type(ret)}")
+            else:
+                raise TypeError(f"test_execution must return a tuple (int, str, dict) or (int, str), got {type(ret)}")
+
+            if not isinstance(next_execution_index, int):
+                raise TypeError(f"First element (next_execution_index) must be int, got {type(next_execution_index)}")
+            if not isinstance(result_category, str):
+                raise TypeError(f"Second element (result_category) must be str, got {type(result_category)}")
+            if not (isinstance(data, dict) or data is None):
+                raise TypeError(f"Third element (extradata) must be dict or None, got {type(data)}")
+
+            return next_execution_index, result_category, data
+
+        # Replace test_execution on this instance (the default implementation stays on the class)
         self._test_execution = func
+        self.test_execution = test_execution
 
     def test_position(self, position_index):
+        # Local references for objects used in the execution loop
+        test_execution = self.test_execution
+        result_types = self.result_types
+        cat_id = self._cat_id
+        log_event = self._log_event
+        progress_every = self.progress_every
+        progress_fmt = "pos: {}/{} ; config: {}/{} ; execution {}/{}: {}\n"
+        num_configs = len(self.glitch_configs)
+        write = sys.stdout.write
+
         self.reset_target() #TODO: usually not needed but make configurable
         for config_index, glitch_config in enumerate(self.glitch_configs):
             # Verify that sequence of faults is not longer than dead_timeout
@@ -458,37 +580,36 @@ class CSProfiler:
 
             self.target_serial.flush()
 
+            num_executions = glitch_config.num_executions
             execution_index = 0
             retry_count = 0
-            while execution_index < glitch_config.num_executions:
+            while execution_index < num_executions:
 
                 try: # Main try block, allowing 3 retries
                     # Run a single fault injection execution
-                    execution_index, result_category, extradata = self.test_execution(position_index, config_index, execution_index)
+                    current_execution_index = execution_index
+                    execution_index, result_category, extradata = test_execution(position_index, config_index, execution_index)
+                    log_event(position_index, config_index, current_execution_index, result_category, extradata)
 
                     # Print info string
-                    print(f"pos: {position_index+1}/{self.num_positions} ; config: {config_index+1}/{len(self.glitch_configs)} ; execution {execution_index}/{glitch_config.num_executions}: {self.result_types[result_category]}]")
+                    if execution_index % progress_every == 0 or execution_index >= num_executions:
+                        write(progress_fmt.format(position_index+1, self.num_positions, config_index+1, num_configs, execution_index, num_executions, result_types[result_category]))
 
                     # Increment result_category in log
-                    config_results[f"num_{result_category}"][position_index] += 1
+                    self.result_counters[config_index, cat_id[result_category], position_index] += 1
 
                     # Add extradata to results
                     if extradata:
-                        # Ensure the category exists
-                        if result_category not in config_results:
-                            config_results[result_category] = []
                         # Check if there is a already a data object for the current position and config_result
-                        try:
-                            if config_results[result_category][-1]["position_index"] == position_index:
-                                data_array = config_results[result_category][-1]["data"]
-                            else:
-                                raise Exception("")
-                        except: # If not, create one
-                            config_results[result_category].append({
+                        bucket = config_results.get(result_category)
+                        if bucket and bucket[-1]["position_index"] == position_index:
+                            data_array = bucket[-1]["data"]
+                        else: # If not, create one (and the category if it doesn't exist yet)
+                            data_array = []
+                            config_results.setdefault(result_category, []).append({
                                 "position_index": position_index,
-                                "data": []
+                                "data": data_array
                             })
-                            data_array = config_results[result_category][-1]["data"]
 
                         data_array.append(extradata)
 
@@ -508,14 +629,18 @@ class CSProfiler:
                     if retry_count < 3:
                         retry_count += 1
                         if str(e) in {"No response from shouter.", "Failed to clear ChipSHOUTER faults!"}:
-                            self.cs.power_cycle_usb()
-                            self.target_serial.flush()
-                            self.reset_target() # TODO: potential errors unhandled
+                            # Reset target while the ChipShouter is power cycled in the background
+                            self.cs.power_cycle_usb(wait=False)
+                            try:
+                                self.target_serial.flush()
+                                self.reset_target() # TODO: potential errors unhandled
+                            finally:
+                                self.cs.wait_for_power_cycle()
                             self.configure_chipshouter(glitch_config)
 
                         elif str(e) in {"ChipWhisperer: reset_target timed out"}: # TODO: custom error type
                             # Try to power cycle and if not enough, reflash target
-                            # Increment config_results["soft_bricked"] or config_results["hard_bricked"] accordingly and go to next execution index
+                            # Increment soft_bricked or hard_bricked counter accordingly and go to next execution index
                             self.cs.disarm() # Disarm shouter to prevent glitching while flashing
                             self.power_cycle_target() # Power cycle chipwhisperer USB port
                             self.target_serial = TargetSerial(SimpleSerial_ChipWhispererLite, self.cw.scope)
@@ -523,14 +648,16 @@ class CSProfiler:
                             try:
                                 # Try to reset target after power cycling
                                 self.reset_target()
-                                config_results["soft_bricked"] += 1
+                                self.result_counters[config_index, cat_id["soft_bricked"], position_index] += 1
+                                log_event(position_index, config_index, execution_index, "soft_bricked")
                                 execution_index += 1
                             except Exception as e:
                                 # If resetting still fails, reflash target and try again (hard_bricked)
                                 print("Resetting, target failed even after power cycling, reflashing target firmware")
                                 self.cw.flash("./target-firmware/build/emfi-profiler-CW308_STM32F4.hex") # Reprogram chipwhisperer
                                 self.reset_target() # TODO: potential errors unhandled
-                                config_results["hard_bricked"] += 1
+                                self.result_counters[config_index, cat_id["hard_bricked"], position_index] += 1
+                                log_event(position_index, config_index, execution_index, "hard_bricked")
                                 execution_index += 1
 
                         else: # unknown error
@@ -538,7 +665,8 @@ class CSProfiler:
                     else: # Limit number of errors per glitch_config and position to 3
                         # Skip the rest of the executions of current glitch_config at current position
                         num_skipped = glitch_config.num_executions - execution_index
-                        config_results["num_skipped"] = num_skipped
+                        self.result_counters[config_index, cat_id["skipped"], position_index] += num_skipped
+                        log_event(position_index, config_index, execution_index, "skipped", {"num_skipped": num_skipped})
                         print(f"Glitch config {config_index} retries exceeded, skipping {num_skipped}")
                         break
 
@@ -552,6 +680,12 @@ class CSProfiler:
         # Setup XYZ Table
         self.table = xyzTable(debug=False)
 
+    def close_delay_controller(self):
+        dc = getattr(self, "dc", None)
+        if dc is not None:
+            dc.__exit__(None, None, None)
+            self.dc = None
+
     def run_campaign(self, build=False, flash=False, home=False):
         self.prepare_hardware()
 
@@ -569,23 +703,29 @@ class CSProfiler:
 
         # Reset catched_errors and results
         self.catched_errors = []
-        self.results = copy.deepcopy(self._results)
+        self.results, self.result_counters = self._fresh_results()
+
+        # Log every execution to results/results_<counter>.ndjson while the campaign is running
+        self.open_event_log()
 
         # Store partial results on Ctrl+c
         signal.signal(signal.SIGINT, self.ctrl_c_signal_handler)
 
-        prev_y = 0
         stepsize_y = 1 # TODO temp workaround, all of this shit should not be needed if xyztable library was properly written
+        # Positions where y decreases by at least stepsize_y compared to the previous position (first position compared to y=0)
+        settle_mask = (np.diff(self._positions_arr[:, 1], prepend=0) <= -stepsize_y).tolist()
         try:
+            # Using Pi Pico as pulse generator (kept open for the whole campaign, opening the port takes longer than configuring it)
+            # Opened inside the try block, so the finally block closes it whatever fails afterwards
+            self.dc = DelayController(port="/dev/ttyACM1").__enter__()
+
             # Iterate over positions
-            for (position_index, position) in enumerate(self.positions):
+            for position_index, (x, y, z) in enumerate(self._positions_arr.tolist()):
                 # Move to position
-                x, y, z = position
                 self.table.move_absolute(x, y, z)
-                if(prev_y - y >= stepsize_y):
+                if settle_mask[position_index]:
                     print("changing pos")
                     time.sleep(5)
-                prev_y = y
 
                 # Test position
                 self.test_position(position_index)
@@ -603,6 +743,10 @@ class CSProfiler:
             traceback.print_exc()
             return -1
 
+        finally:
+            self.close_delay_controller()
+            self.close_event_log()
+
 
         # Finish campaign
         self.cs.disarm()
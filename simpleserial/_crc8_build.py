@@ -0,0 +1,22 @@
+"""
+Build script for the optional C implementation of the SimpleSerial CRC-8 (`_crc8_ext`).
+
+Build it in place (requires cffi and a C compiler) with:
+    python simpleserial/_crc8_build.py
+
+TargetSerial._calc_crc() uses the compiled module if it can be imported, otherwise it falls back
+to numba (if installed) or the Python/numpy implementations.
+"""
+import os
+from cffi import FFI
+
+_DIR = os.path.dirname(os.path.abspath(__file__))
+
+ffibuilder = FFI()
+ffibuilder.cdef("uint8_t crc8_4d(const uint8_t *buf, size_t n);")
+
+with open(os.path.join(_DIR, "crc8.c")) as f:
+    ffibuilder.set_source("_crc8_ext", f.read())
+
+if __name__ == "__main__":
+    ffibuilder.compile(tmpdir=_DIR, verbose=True)
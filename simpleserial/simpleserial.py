@@ -1,8 +1,125 @@
 from .simpleserial_readers.cwlite import SimpleSerial_ChipWhispererLite
-from collections import OrderedDict, deque
+from collections import OrderedDict
 import time
 import inspect
 import ctypes
+import functools
+import keyword
+import struct
+
+try:
+    import numpy as np
+except ImportError:
+    np = None # optional, vectorized CRC of long buffers is skipped without it
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None # optional, pure Python/numpy CRC is used without it
+
+try:
+    # Optional C implementation of the CRC (build with `python simpleserial/_crc8_build.py`)
+    from ._crc8_ext import ffi as _crc8_ffi, lib as _crc8_lib
+except ImportError:
+    _crc8_ffi, _crc8_lib = None, None
+
+def _build_crc8_table(poly: int) -> bytes:
+    """
+    Build the 256 entry lookup table for a CRC-8 with polynomial `poly` (MSB first, no reflection).
+    table[b] is the CRC register after shifting in byte b starting from 0.
+    """
+    table = bytearray(256)
+    for b in range(256):
+        crc = b
+        for _ in range(8):
+            if crc & 0x80:
+                crc = ((crc << 1) ^ poly) & 0xFF
+            else:
+                crc = (crc << 1) & 0xFF
+        table[b] = crc
+    return bytes(table)
+
+# CRC-8 (poly 0x4D) lookup table used by TargetSerial._calc_crc()
+_CRC8_4D_TABLE = _build_crc8_table(0x4D)
+
+# Positional tables for the vectorized CRC of longer buffers (see _calc_crc_numpy()).
+# The CRC is linear, so the CRC of a buffer is the XOR of the contributions of its bytes:
+#   _CRC8_4D_POS_TABLE[k][b] = CRC of byte b followed by k zero bytes
+_CRC8_BLOCK_SIZE = 256
+if np is not None:
+    _CRC8_4D_POS_TABLE = np.empty((_CRC8_BLOCK_SIZE, 256), dtype=np.uint8)
+    _CRC8_4D_POS_TABLE[0] = np.frombuffer(_CRC8_4D_TABLE, dtype=np.uint8)
+    for _k in range(1, _CRC8_BLOCK_SIZE):
+        _CRC8_4D_POS_TABLE[_k] = _CRC8_4D_POS_TABLE[0][_CRC8_4D_POS_TABLE[_k - 1]]
+    del _k
+    _CRC8_ROWS = np.arange(_CRC8_BLOCK_SIZE - 1, -1, -1) # row (number of following bytes) for each byte of a full block
+
+# Buffers shorter than this are faster with the table loop (numpy call overhead, crossover measured at ~200 bytes)
+_CRC8_NUMPY_MIN_LEN = 256
+
+if njit is not None:
+    _CRC8_4D_TABLE_ARR = np.frombuffer(_CRC8_4D_TABLE, dtype=np.uint8)
+
+    @njit(cache=True, boundscheck=False)
+    def _crc8_njit(a):
+        """
+        CRC-8 (0x4D) of a uint8 array, compiled with numba.
+        """
+        crc = 0
+        for b in a:
+            crc = _CRC8_4D_TABLE_ARR[crc ^ b]
+        return crc
+else:
+    _crc8_njit = None
+
+def _calc_crc_numpy(buf) -> int:
+    """
+    CRC-8 (0x4D) of a bytes-like buffer, vectorized over blocks of up to 256 bytes.
+    """
+    a = np.frombuffer(buf, dtype=np.uint8)
+    crc = 0
+    for start in range(0, len(a), _CRC8_BLOCK_SIZE):
+        block = a[start:start + _CRC8_BLOCK_SIZE]
+        n = len(block)
+        # Contributions of the block bytes + contribution of the CRC register carried in from the previous block
+        block_crc = np.bitwise_xor.reduce(_CRC8_4D_POS_TABLE[_CRC8_ROWS[_CRC8_BLOCK_SIZE - n:], block])
+        crc = int(block_crc) ^ int(_CRC8_4D_POS_TABLE[n - 1, crc])
+    return crc
+
+def _str_to_cmd(cmd: str) -> int:
+    if len(cmd) == 0:
+        raise ValueError("Command string cannot be empty")
+    return ord(cmd[0])
+
+def _int_to_data(data: int) -> bytes:
+    if not (0 <= data <= 255):
+        raise ValueError(f"Integer out of byte range: {data}")
+    return bytes((data,))
+
+# Exact type -> converter for TargetSerial.type_convert_cmd() / type_convert_data()
+# (other types, e.g. subclasses, go through the isinstance checks)
+_CMD_CONVERTERS = {
+    int: int,
+    str: _str_to_cmd,
+}
+_DATA_CONVERTERS = {
+    bytes: bytes,
+    bytearray: bytes,
+    str: lambda data: data.encode("ascii"),
+    list: bytes,
+    tuple: bytes,
+    int: _int_to_data,
+}
+
+@functools.lru_cache(maxsize=None)
+def _con_num_mandatory_params(driver_cls) -> int:
+    """
+    Number of mandatory positional parameters of driver_cls.con() (without self), inspected once per driver class.
+    """
+    return sum(p.default is inspect.Parameter.empty
+            for p in list(inspect.signature(driver_cls.con).parameters.values())[1:]
+            if p.kind in (inspect.Parameter.POSITIONAL_ONLY,
+                        inspect.Parameter.POSITIONAL_OR_KEYWORD))
 
 def dict_to_str(input_dict: dict, indent=""):
     """
@@ -42,21 +159,18 @@ def dict_to_str(input_dict: dict, indent=""):
             printing to the console.
     """
     # Find minimum width that fits all names
-    min_width = 0
-    for n in input_dict:
-        min_width = max(min_width, len(str(n)))
-
-    # Build string
-    ret = ""
-    for n in input_dict:
-        if isinstance(input_dict[n], dict):
-            ret += indent + str(n) + ' = '
-            ret += '\n' + dict_to_str(input_dict[n], indent+"    ")
+    min_width = max(map(len, map(str, input_dict)), default=0)
+
+    # Build string (collect parts and join once)
+    parts = []
+    for n, value in input_dict.items():
+        if isinstance(value, dict):
+            parts.append(f"{indent}{n} = \n")
+            parts.append(dict_to_str(value, indent+"    "))
         else:
-            ret += indent + str(n).ljust(min_width) + ' = '
-            ret += str(input_dict[n]) + '\n'
+            parts.append(f"{indent}{str(n).ljust(min_width)} = {value}\n")
 
-    return ret
+    return "".join(parts)
 
 class PacketDataStruct(ctypes.Structure):
     """
@@ -89,29 +203,125 @@ class PacketDataStruct(ctypes.Structure):
     """
     _pack_ = 1 # no padding between fields
 
-    def as_dict(self):
-        result = {}
-        # Iterate over all fields of the ctypes struct
-        for field_name, field_type in self._fields_:
-            value = getattr(self, field_name)
-            # Handle byte arrays (e.g. c_uint8 * N) -> make sure that the dict values are json serializable for logging
-            if issubclass(field_type, ctypes.Array):
-                # Check element type
-                elem_type = field_type._type_
-                if elem_type in (ctypes.c_uint8, ctypes.c_byte):
-                    # Byte array:
-                    result[field_name] = bytes(value)
-                elif elem_type == ctypes.c_char:
-                    # String
-                    result[field_name] = bytes(value)
+    @classmethod
+    def _field_converters(cls) -> list:
+        """
+        List of (field_name, converter) for as_dict(), resolved once per class.
+        converter is None for fields that are used as-is.
+        """
+        converters = cls.__dict__.get("_as_dict_converters")
+        if converters is None:
+            converters = []
+            # Iterate over all fields of the ctypes struct
+            for field_name, field_type in cls._fields_:
+                # Handle byte arrays (e.g. c_uint8 * N) -> make sure that the dict values are json serializable for logging
+                if issubclass(field_type, ctypes.Array):
+                    # Check element type
+                    elem_type = field_type._type_
+                    if elem_type in (ctypes.c_uint8, ctypes.c_byte):
+                        # Byte array:
+                        converters.append((field_name, bytes))
+                    elif elem_type == ctypes.c_char:
+                        # String
+                        converters.append((field_name, bytes))
+                    else:
+                        # Fallback: convert array elements to list
+                        converters.append((field_name, list))
                 else:
-                    # Fallback: convert array elements to list
-                    result[field_name] = list(value)
+                    # Primitive types (int, uint, etc)
+                    converters.append((field_name, None))
+            cls._as_dict_converters = converters
+        return converters
+
+    @classmethod
+    def _compile_as_dict(cls):
+        """
+        Generate an as_dict() implementation specialized for the fields of this class
+        (a single dict literal, e.g. `{'target_buffer': bytes(self.target_buffer), 'variable_1': self.variable_1}`).
+        """
+        items = []
+        for field_name, convert in cls._field_converters():
+            if field_name.isidentifier() and not keyword.iskeyword(field_name):
+                value = f"self.{field_name}"
             else:
-                # Primitive types (int, uint, etc)
-                result[field_name] = value
+                value = f"getattr(self, {field_name!r})"
+            if convert is not None:
+                value = f"{convert.__name__}({value})"
+            items.append(f"{field_name!r}: {value}")
+
+        source = "def as_dict(self):\n    return {" + ", ".join(items) + "}\n"
+        namespace = {"bytes": bytes, "list": list}
+        exec(source, namespace)
+
+        cls._as_dict_impl = namespace["as_dict"]
+        return cls._as_dict_impl
+
+    def as_dict(self):
+        impl = type(self).__dict__.get("_as_dict_impl")
+        if impl is None:
+            impl = type(self)._compile_as_dict()
+        return impl(self)
+
+@functools.lru_cache(maxsize=64)
+def _make_packet_data_class(struct_fields: tuple) -> type:
+    """
+    Create (and cache) the PacketDataStruct subclass for a field list (as tuple of (name, ctype) tuples).
+    Creating ctypes structure classes is expensive, so every field list is only turned into a class once.
+    """
+    class PacketData(PacketDataStruct):
+        _fields_ = list(struct_fields)
+
+    PacketData._struct_size = ctypes.sizeof(PacketData)
+    return PacketData
+
+# struct format characters for integer ctypes by (signed, size)
+_STRUCT_INT_CODES = {
+    (True, 1): "b", (True, 2): "h", (True, 4): "i", (True, 8): "q",
+    (False, 1): "B", (False, 2): "H", (False, 4): "I", (False, 8): "Q",
+}
+
+@functools.lru_cache(maxsize=64)
+def _compile_packet_struct(struct_fields: tuple):
+    """
+    Compile a field list (as tuple of (name, ctype) tuples) to a struct.Struct (native byte order, no padding).
+
+    Supported are integer, float, bool and char fields as well as byte (c_uint8/c_byte * N) and char (c_char * N) arrays.
+    The values are the same as returned by PacketDataStruct.as_dict() (char arrays are cut at the first null byte).
+
+    Returns:
+        tuple[struct.Struct, list[str], list[str]] | None: (compiled struct, field names, names of char array fields)
+            or None if a field type is not supported (parse with ctypes instead).
+    """
+    fmt = "="
+    names = []
+    char_array_names = []
+    for field in struct_fields:
+        if len(field) != 2:
+            return None # bit fields
+        name, field_type = field
+
+        if issubclass(field_type, ctypes.Array):
+            elem_type = field_type._type_
+            if elem_type in (ctypes.c_uint8, ctypes.c_byte):
+                fmt += f"{field_type._length_}s"
+            elif elem_type == ctypes.c_char:
+                fmt += f"{field_type._length_}s"
+                char_array_names.append(name)
+            else:
+                return None # arrays of other types are returned as lists by as_dict()
+        elif issubclass(field_type, ctypes._SimpleCData):
+            code = field_type._type_
+            if code in "bBhHiIlLqQ":
+                code = _STRUCT_INT_CODES[(code.islower(), ctypes.sizeof(field_type))]
+            elif code not in "fd?c":
+                return None
+            fmt += code
+        else:
+            return None # nested structures, pointers, ...
+
+        names.append(name)
 
-        return result
+    return struct.Struct(fmt), names, char_array_names
 
 class SimpleSerial_Err:
     OK = 0
@@ -195,10 +405,7 @@ class TargetSerial:
         Raises:
             ValueError: If `driver` requires the interface parameter but self.interface is None.
         """
-        con_num_mandatory_params = sum(p.default is inspect.Parameter.empty
-                for p in inspect.signature(self.ser.con).parameters.values()
-                if p.kind in (inspect.Parameter.POSITIONAL_ONLY,
-                            inspect.Parameter.POSITIONAL_OR_KEYWORD))
+        con_num_mandatory_params = _con_num_mandatory_params(type(self.ser))
 
         if not self.interface and con_num_mandatory_params > 0:
             raise ValueError(f"SimpleSerial driver {type(self.ser)} con() method requires the interface parameter.")
@@ -223,17 +430,23 @@ class TargetSerial:
         Raises:
             RuntimeError: If CRC calculation failed.
         """
+        if isinstance(buf, (bytes, bytearray, memoryview)):
+            # C extension if it was built
+            if _crc8_lib is not None:
+                return _crc8_lib.crc8_4d(_crc8_ffi.from_buffer(buf), len(buf))
+            # Compiled loop if numba is installed
+            if _crc8_njit is not None:
+                return int(_crc8_njit(np.frombuffer(buf, dtype=np.uint8)))
+            # Long buffers: vectorized positional table lookup
+            if np is not None and len(buf) >= _CRC8_NUMPY_MIN_LEN:
+                return _calc_crc_numpy(buf)
+
+        # Table driven: one lookup per byte instead of 8 shift/xor steps
+        table = _CRC8_4D_TABLE
         crc = 0x00
         try:
             for b in buf:
-                crc ^= b
-                for _ in range(8):
-                    if crc & 0x80:
-                        crc = (crc << 1) ^ 0x4D
-                        crc &= 0xFF
-                    else:
-                        crc <<= 1
-                        crc &= 0xFF
+                crc = table[crc ^ b]
         except Exception as e:
             raise RuntimeError(f"CRC calculation failed for buffer {buf}") from e
 
@@ -272,24 +485,46 @@ class TargetSerial:
         if not buf:
             return b""
 
-        out = bytearray([0])  # placeholder for first code byte
-        code = 1  # code byte (length of block +1)
-        code_index = 0  # index of last code byte
-
-        for b in buf:
-            # frame_byte is detected or block length reached 0xFF
-            if b == frame_byte or code == 0xFF:
-                # close current block
-                out[code_index] = code
-                code_index = len(out)
-                out.append(0)  # append new placeholder for next code
-                code = 1
-            if b != frame_byte:
-                out.append(b)
-                code += 1
-
-        out[code_index] = code  # finalize last block
-        return bytes(out)  # return immutable bytes obect
+        n = len(buf)
+        out = bytearray(n + n // 254 + 2)  # worst case size (one code byte per 254 data bytes + last code byte)
+        w = TargetSerial._cobs_stuff_into(buf, out, 0, frame_byte)
+        return bytes(memoryview(out)[:w])  # return immutable bytes obect (single copy)
+
+    @staticmethod
+    def _cobs_stuff_into(buf: bytes, out: bytearray, w: int, frame_byte: int = 0x00) -> int:
+        """
+        COBS encode non-empty `buf` into the preallocated `out` starting at index `w` (see `_cobs_stuff_data()`).
+        `out` needs space for len(buf) + len(buf) // 254 + 1 bytes after `w`.
+
+        Returns:
+            int: Index in `out` after the last written byte.
+        """
+        n = len(buf)
+        pos = 0  # start of the current block in buf
+
+        while True:
+            # Find end of block (next frame_byte within the maximum block length of 254 bytes)
+            nxt = buf.find(frame_byte, pos, pos + 254)
+            if nxt == -1:
+                end = min(pos + 254, n)
+                run = end - pos
+                # Block without frame_byte (max length or end of data)
+                out[w] = run + 1
+                out[w + 1:w + 1 + run] = buf[pos:end]
+                w += 1 + run
+                pos = end
+                if pos == n:
+                    break
+            else:
+                # Block terminated by frame_byte (frame_byte itself is not stored)
+                run = nxt - pos
+                out[w] = run + 1
+                out[w + 1:w + 1 + run] = buf[pos:nxt]
+                w += 1 + run
+                pos = nxt + 1
+                # A trailing frame_byte is followed by an empty block (handled by the next iteration)
+
+        return w
 
     @staticmethod
     def _cobs_unstuff_data(buf: bytes, frame_byte: int = 0x00) -> bytes:
@@ -325,9 +560,10 @@ class TargetSerial:
         if not buf:
             return b""
 
-        out = bytearray()
-        index = 0
         length = len(buf)
+        out = bytearray(length)  # decoded data is always shorter than the encoded data
+        w = 0  # write index in out
+        index = 0
 
         while index < length:
             code = buf[index]
@@ -341,14 +577,17 @@ class TargetSerial:
                 raise ValueError("Invalid COBS: block extends past end of buffer")
 
             # Copy the block bytes
-            out.extend(buf[index:end])
+            run = end - index
+            out[w:w + run] = buf[index:end]
+            w += run
             index = end
 
             # Add a zero only if code < 0xFF and we’re not at the end
             if code < 0xFF and index < length:
-                out.append(frame_byte)
+                out[w] = frame_byte
+                w += 1
 
-        return bytes(out)  # return immutable bytes obect
+        return bytes(memoryview(out)[:w])  # return immutable bytes obect
 
     @staticmethod
     def _verify_crc(buf: bytes) -> bool:
@@ -365,7 +604,7 @@ class TargetSerial:
             # Not enough data to have CRC
             return False
 
-        data = buf[:-1]  # All bytes except the last one (CRC)
+        data = memoryview(buf)[:-1]  # All bytes except the last one (CRC), without copying
         received_crc = buf[-1]
 
         calculated_crc = TargetSerial._calc_crc(data)
@@ -387,15 +626,17 @@ class TargetSerial:
         Returns:
             int: Command as a single byte integer.
         """
-        # Convert str to int (use first character)
-        if isinstance(cmd, str):
-            if len(cmd) == 0:
-                raise ValueError("Command string cannot be empty")
-            cmd = ord(cmd[0])
+        convert = _CMD_CONVERTERS.get(type(cmd))
+        if convert is not None:
+            cmd = convert(cmd)
+        else:
+            # Convert str to int (use first character)
+            if isinstance(cmd, str):
+                cmd = _str_to_cmd(cmd)
 
-        # Verify type
-        if not isinstance(cmd, int):
-            raise TypeError(f"Unsupported command type: {type(cmd)}")
+            # Verify type
+            if not isinstance(cmd, int):
+                raise TypeError(f"Unsupported command type: {type(cmd)}")
 
         # Verify value range
         if not (0 <= cmd <= 255):
@@ -424,15 +665,17 @@ class TargetSerial:
         Returns:
             bytes: Converted data
         """
+        convert = _DATA_CONVERTERS.get(type(data))
+        if convert is not None:
+            return convert(data)
+
         # Type convert data
         if isinstance(data, list) or isinstance(data, tuple):
             data = bytearray(data)
         elif isinstance(data, str):
             data = data.encode("ascii")
         elif isinstance(data, int):
-            if not (0 <= data <= 255):
-                raise ValueError(f"Integer out of byte range: {data}")
-            data = bytes([data])
+            data = _int_to_data(data)
 
         # Verify data type
         elif not isinstance(data, (bytes, bytearray)):
@@ -468,10 +711,21 @@ class TargetSerial:
             ]
             ```
         """
-        class PacketData(PacketDataStruct):
-            _fields_ = struct_fields
-
-        struct_size = ctypes.sizeof(PacketData)
+        key = tuple(tuple(field) for field in struct_fields)
+
+        # Fast path: parse with struct (no ctypes object and attribute access)
+        compiled = _compile_packet_struct(key)
+        if compiled is not None:
+            compiled_struct, names, char_array_names = compiled
+            if len(data) < compiled_struct.size:
+                raise ValueError(f"Data too short (expected {compiled_struct.size} bytes, got {len(data)})")
+            result = dict(zip(names, compiled_struct.unpack_from(data)))
+            for name in char_array_names:
+                result[name] = result[name].split(b"\x00", 1)[0]
+            return result
+
+        PacketData = _make_packet_data_class(key)
+        struct_size = PacketData._struct_size
 
         # Ensure received data is long enough
         if len(data) < struct_size:
@@ -482,6 +736,32 @@ class TargetSerial:
         return parsed.as_dict()
 
 
+    @staticmethod
+    def _build_packet(cmd: int, data: bytes) -> bytearray:
+        """
+        Build a packet with data: [cmd, COBS([data, crc]), 0x00]
+
+        The COBS encoded block is written directly into the final packet buffer
+        (no separate buffers for the encoded block and the packet).
+
+        Args:
+            cmd (int): Command byte
+            data (bytes): Non-empty packet data
+
+        Returns:
+            bytearray: The complete packet including terminator
+        """
+        # Block = data + crc (CRC over data only)
+        block = data + bytes((TargetSerial._calc_crc(data),))
+        n = len(block)
+
+        pkt = bytearray(n + n // 254 + 3)  # cmd + encoded block (worst case) + terminator
+        pkt[0] = cmd
+        w = TargetSerial._cobs_stuff_into(block, pkt, 1)
+        pkt[w] = 0x00
+        del pkt[w + 1:]
+        return pkt
+
     def send_packet(self, cmd, data=None, timeout=0):
         """
         Send a SimpleSerial packet to the target device.
@@ -507,31 +787,15 @@ class TargetSerial:
 
         # Packet without data (just send command and terminator)
         if not data:
-            buf = bytearray([cmd, 0])
-            self.write(buf, timeout)
+            self._write_bytes(bytes((cmd, 0)), timeout)
             return
 
         # Packet with data (send encoded packet)
         else:
-            # Compute CRC over data only
-            crc = self._calc_crc(data)
-
-            # Build block = data + crc
-            block = data + bytes([crc])
-
-            # COBS encode
-            encoded = self._cobs_stuff_data(block)
-
-            # Final packet: cmd + encoded + terminator
-            pkt = bytearray([cmd])
-            pkt.extend(encoded)
-            pkt.append(0x00)
-
-            # Send
-            self.write(buf, timeout)
+            self._write_bytes(self._build_packet(cmd, data), timeout)
 
     def send_ack(self, cmd, timeout=0):
-        self.send_packet(cmd, timeout)
+        self.send_packet(cmd, timeout=timeout)
 
     def read(self, num_bytes = 0, timeout = 250) -> bytes:
         """ Reads data from the target over serial.
@@ -577,20 +841,26 @@ class TargetSerial:
         """
         sequence = self.type_convert_data(sequence)
 
+        ser = self.ser
         result = bytearray()
         seq_len = len(sequence)
-        buffer = deque(maxlen=seq_len)  # keeps only last seq_len bytes
-        end_time = time.time() + (timeout / 1000.0)
-
-        while time.time() < end_time:
-            byte_read = self.ser.read_bytes(1, timeout=10)
-            if byte_read:
-                b = byte_read[0]
-                result.append(b)
-                buffer.append(b)
-
-                # Always check only the last seq_len bytes
-                if len(buffer) == seq_len and bytes(buffer) == bytes(sequence):
+        # Monotonic clock (time.time() can jump on NTP adjustments), checked once per chunk
+        deadline_ns = time.monotonic_ns() + int(timeout * 1_000_000)
+
+        while time.monotonic_ns() < deadline_ns:
+            # Read everything that is available (at least one byte, waiting max 10 ms)
+            chunk = ser.read_bytes(ser.inWaiting() or 1, timeout=10)
+            if chunk:
+                # Only the new bytes (and the seq_len - 1 bytes before them) can complete the sequence
+                search_start = max(0, len(result) - seq_len + 1)
+                result += chunk
+                index = result.find(sequence, search_start)
+                if index != -1:
+                    end = index + seq_len
+                    # Put bytes received after the sequence back into the reader
+                    if end < len(result):
+                        ser.unread_bytes(result[end:])
+                        del result[end:]
                     break
 
         return bytes(result)
@@ -638,17 +908,15 @@ class TargetSerial:
             >>> cmd, data = obj.read_packet(timeout=500)
             >>> print(cmd, data)
         """
-        buf = bytearray()
+        # read_until() drains everything the reader has available per call
+        # and keeps bytes received after the terminator for the next read
         buf = self.read_until(self._frame_byte, timeout)
 
         if not buf.endswith(self._frame_byte):
             raise TimeoutError("receive_packet: Timeout waiting for packet terminator")
 
-        # Strip terminator
-        buf = buf[:-1]
-
-        # Packet without data
-        if len(buf) == 1:
+        # Packet without data ([cmd, terminator])
+        if len(buf) == 2:
             cmd = buf[0]
             data = None
             return (cmd, data)
@@ -657,8 +925,8 @@ class TargetSerial:
         else:
             cmd = buf[0]
 
-            # Extract COBS-encoded block
-            encoded = buf[1:]
+            # Extract COBS-encoded block (between cmd and terminator, without copying)
+            encoded = memoryview(buf)[1:-1]
             decoded = self._cobs_unstuff_data(encoded)
             if len(decoded) < 1:
                 raise ValueError("read_packet: decode failed")
@@ -737,6 +1005,12 @@ class TargetSerial:
 
         self.ser.write(data, timeout)
 
+    def _write_bytes(self, data, timeout=0):
+        """
+        Write already converted data (bytes or bytearray) without type conversion. Used internally, see write().
+        """
+        self.ser.write(data, timeout)
+
     # Serial buffer status
     def in_waiting(self):
         """
@@ -216,6 +216,21 @@ class SimpleSerialTemplate:
     def peek(self, num=0, timeout=250) -> str:
         return self.peek_bytes(self, num, timeout).decode('latin-1')
 
+    def unread_bytes(self, data):
+        """
+        Put bytes that were already read back to the front of the target buffer, so they are returned
+        by the next read_bytes() call. Used by readers that read in chunks and consumed more than needed.
+        The bytes were already added to the terminal queue when they were read, so it is not updated.
+
+        Args:
+            data: Bytes to put back (in the order they were received)
+
+        Returns:
+            None
+        """
+        self.target_queue.extendleft(reversed(data))
+        self.target_count += len(data)
+
     def flush(self):
         """
         Remove any waiting data from the target buffer.
@@ -4,6 +4,8 @@ from .config_classes import GlitchConfig, TargetConfig, SimpleSerialPacket
 from .profile_target import CSProfiler
 import ctypes
 
+import numpy as np
+
 from simpleserial.simpleserial import TargetSerial
 
 def memcpy_fault_handler(profilerSelf, packetSelf, data=None):
@@ -25,19 +27,16 @@ def get_raster_positions(origin, dim_x, dim_y, stepsize_x, stepsize_y):
     Starting at origin, returned positions are absolute. Z axis stays fixed at value from origin.
 
     Returns:
-        List: List of positions [x, y, z]
+        np.ndarray: (N, 3) array of positions [x, y, z]
     """
 
-    # Generate coordinate lists for x and y
-    x_coords = [origin[0] + x * stepsize_x for x in range(int(dim_x / stepsize_x) + 1)]
-    y_coords = [origin[1] + y * stepsize_y for y in range(int(dim_y / stepsize_y) + 1)]
+    # Generate coordinates for x and y
+    xs = origin[0] + np.arange(int(dim_x / stepsize_x) + 1) * stepsize_x
+    ys = origin[1] + np.arange(int(dim_y / stepsize_y) + 1) * stepsize_y
 
-    # Create grid positions
-    positions = [
-        [x, y, origin[2]]  # Constant z-value
-        for x in x_coords
-        for y in y_coords
-    ]
+    # Create grid positions (x outer, y inner), constant z-value
+    X, Y = np.meshgrid(xs, ys, indexing="ij")
+    positions = np.column_stack((X.ravel(), Y.ravel(), np.full(X.size, origin[2])))
 
     return positions
 
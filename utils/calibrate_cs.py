@@ -15,8 +15,15 @@ cs.voltage = 400
 cs.clear_faults()
 cs.arm()
 time.sleep(3)
+
+# Pulse every 3s (deadline based, so the time cs.pulse() takes does not add to the interval)
+pulse_interval = 3
+next_pulse = time.monotonic()
 while True:
     cs.pulse()
-    time.sleep(3)
+    next_pulse += pulse_interval
+    delay = next_pulse - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
 
     # time.sleep(5)
\ No newline at end of file
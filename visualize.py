@@ -6,15 +6,46 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.widgets import Button, TextBox
 from matplotlib import colors
 from matplotlib.patches import Patch
+import os
 import sys
 import json
+import functools
 import signal
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None # optional, results files are always loaded completely without it
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None # optional, numpy classify_colors() is used without it
 
 
 DEFAULT_JSON_PATH = 'results.json'
+# Results files of at least this size are loaded lazily (results of a glitch_config are parsed when it is shown, requires ijson)
+LAZY_LOAD_MIN_SIZE = 500 * 1024 * 1024
+
+# Gradient colors (parsed once instead of on every classify_color() call)
+_FAULT_START_RGB = colors.to_rgb("#cffc03")         # yellow-green start
+_FAULT_END_RGB = colors.to_rgb("#ff0000")           # red end
+_INSTABILITY_START_RGB = colors.to_rgb("#03fc9d")   # teal start
+_INSTABILITY_END_RGB = colors.to_rgb("#0000ff")     # blue end
+
 def mix_colors(c1, c2, ratio):
     """Linearly interpolate between two RGB tuples."""
-    return tuple(c1[i] * (1 - ratio) + c2[i] * ratio for i in range(3))
+    return (
+        c1[0] + (c2[0] - c1[0]) * ratio,
+        c1[1] + (c2[1] - c1[1]) * ratio,
+        c1[2] + (c2[2] - c1[2]) * ratio,
+    )
 
 def classify_color(num_nofaults, num_faults, num_crashes, num_resets, num_soft_bricked, num_hard_bricked, num_skipped):
     """Return hex color for a given point based on result ratios."""
@@ -37,35 +68,207 @@ def classify_color(num_nofaults, num_faults, num_crashes, num_resets, num_soft_b
 
     # Yellow - Red: Some faults occured (color depending on faults / n executions)
     if num_faults > 0:
-        start_color = colors.to_rgb("#cffc03")  # yellow-green start
-        end_color = colors.to_rgb("#ff0000")    # red end
-        denom = num_nofaults + num_resets + num_crashes + num_soft_bricked + num_hard_bricked
         ratio = num_faults / sum_results
-        return colors.to_hex(mix_colors(start_color, end_color, ratio))
+        return colors.to_hex(mix_colors(_FAULT_START_RGB, _FAULT_END_RGB, ratio))
 
     # Blue: No faults, but resets or crashes (color depending on ration of (resets + crashes) / n executions)
     if num_faults == 0 and num_instabilities > 0:
-        start_color = colors.to_rgb("#03fc9d")  # teal start
-        end_color = colors.to_rgb("#0000ff")    # blue end
         ratio = num_instabilities / sum_results
-        return colors.to_hex(mix_colors(start_color, end_color, ratio))
+        return colors.to_hex(mix_colors(_INSTABILITY_START_RGB, _INSTABILITY_END_RGB, ratio))
 
     return "gray"
 
+# Colors used by classify_colors(): gray, green, red, fault gradient (start, end), instability gradient (start, end)
+_CLASSIFY_COLORS_TABLE = np.array([
+    colors.to_rgb("gray"), colors.to_rgb("green"), colors.to_rgb("red"),
+    _FAULT_START_RGB, _FAULT_END_RGB, _INSTABILITY_START_RGB, _INSTABILITY_END_RGB,
+])
+
+# Edge colors of the points: black, pink (executions were skipped)
+_EDGE_COLORS_TABLE = np.array([colors.to_rgb("black"), colors.to_rgb("#F80BD8")])
+
+# Gradients are quantized to this many steps (same resolution as the hex colors of classify_color())
+_CLASSIFY_GRADIENT_STEPS = 256
+
+def _gradient(start_color, end_color, steps=_CLASSIFY_GRADIENT_STEPS):
+    ratio = np.linspace(0, 1, steps)[:, None]
+    return start_color + (end_color - start_color) * ratio
+
+# Lookup table for classify_colors(): gray, green, red, fault gradient, instability gradient
+_CLASSIFY_COLORS_LUT = np.concatenate((
+    _CLASSIFY_COLORS_TABLE[:3],
+    _gradient(_CLASSIFY_COLORS_TABLE[3], _CLASSIFY_COLORS_TABLE[4]),
+    _gradient(_CLASSIFY_COLORS_TABLE[5], _CLASSIFY_COLORS_TABLE[6]),
+))
+
+# Below this number of points the numba kernel is not worth it (thread startup outweighs the saved numpy temporaries)
+_CLASSIFY_NJIT_MIN_POINTS = 10000
+
+if njit is not None:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _classify_colors_njit(num_nofaults, num_faults, num_crashes, num_resets, num_soft_bricked,
+                              num_hard_bricked, num_skipped, lut, steps, out_rgb):
+        """
+        classify_color() for every point, compiled with numba. Writes the RGB colors from lut to out_rgb.
+        """
+        for i in prange(num_faults.shape[0]):
+            num_instabilities = num_resets[i] + num_crashes[i] + num_soft_bricked[i] + num_hard_bricked[i]
+            sum_results = num_nofaults[i] + num_faults[i] + num_instabilities # NOT including num_skipped
+
+            lut_index = 0 # gray
+            if sum_results == 0:
+                lut_index = 0
+            elif num_faults[i] + num_instabilities + num_skipped[i] == 0:
+                lut_index = 1
+            elif num_faults[i] > 0 and num_nofaults[i] == 0 and num_resets[i] == 0 and num_crashes[i] == 0:
+                lut_index = 2
+            elif num_faults[i] > 0:
+                lut_index = 3 + (num_faults[i] * (steps - 1) + sum_results // 2) // sum_results
+            elif num_instabilities > 0:
+                lut_index = 3 + steps + (num_instabilities * (steps - 1) + sum_results // 2) // sum_results
+
+            for c in range(3):
+                out_rgb[i, c] = lut[lut_index, c]
+else:
+    _classify_colors_njit = None
+
+def classify_colors(results, num_points):
+    """
+    Vectorized classify_color() for all points of a glitch_config.
+
+    Args:
+        results (dict): Results of the glitch_config ("num_<type>" lists with one entry per point)
+        num_points (int): Number of points (positions)
+
+    Returns:
+        np.ndarray: (num_points, 3) RGB array (same color rules as classify_color())
+    """
+    def counts(key):
+        if key in results:
+            return np.ascontiguousarray(results[key], dtype=np.int64)
+        return np.zeros(num_points, dtype=np.int64)
+
+    num_nofaults = counts("num_nofaults")
+    num_faults = counts("num_faults")
+    num_crashes = counts("num_crashes")
+    num_resets = counts("num_resets")
+    num_soft_bricked = counts("num_soft_bricked")
+    num_hard_bricked = counts("num_hard_bricked")
+    num_skipped = counts("num_skipped")
+
+    # Single pass compiled kernel for large campaigns (numpy temporaries dominate there)
+    if _classify_colors_njit is not None and num_points >= _CLASSIFY_NJIT_MIN_POINTS:
+        rgb = np.empty((num_points, 3))
+        _classify_colors_njit(num_nofaults, num_faults, num_crashes, num_resets, num_soft_bricked,
+                              num_hard_bricked, num_skipped, _CLASSIFY_COLORS_LUT, _CLASSIFY_GRADIENT_STEPS, rgb)
+        return rgb
+
+    num_instabilities = num_resets + num_crashes + num_soft_bricked + num_hard_bricked
+    sum_results = num_nofaults + num_faults + num_instabilities # NOT including num_skipped
+    # Avoid division by zero (those points are gray anyway)
+    denom = np.maximum(sum_results, 1)
+
+    # Masks in the same priority order as classify_color() (every point ends up in at most one)
+    has_data = sum_results > 0
+    green = has_data & (num_faults + num_instabilities + num_skipped == 0)
+    remaining = has_data & ~green
+    red = remaining & (num_faults > 0) & (num_nofaults == 0) & (num_resets == 0) & (num_crashes == 0)
+    remaining &= ~red
+    fault_gradient = remaining & (num_faults > 0)
+    instability_gradient = remaining & (num_faults == 0) & (num_instabilities > 0)
+
+    # Index into _CLASSIFY_COLORS_LUT, gray: no data (or all skipped) and everything not matched below
+    lut_index = np.zeros(num_points, dtype=np.intp)
+    lut_index[green] = 1
+    lut_index[red] = 2
+
+    # Yellow - Red: Some faults occured (color depending on faults / n executions)
+    steps = _CLASSIFY_GRADIENT_STEPS - 1
+    fault_step = (num_faults * steps + denom // 2) // denom # round(ratio * steps)
+    lut_index[fault_gradient] = 3 + fault_step[fault_gradient]
+
+    # Blue: No faults, but resets or crashes (color depending on ration of (resets + crashes) / n executions)
+    instability_step = (num_instabilities * steps + denom // 2) // denom
+    lut_index[instability_gradient] = 3 + _CLASSIFY_GRADIENT_STEPS + instability_step[instability_gradient]
+
+    rgb = _CLASSIFY_COLORS_LUT[lut_index]
+    return rgb
+
+def load_results_headers(json_path):
+    """
+    Load a results JSON without the results of its glitch_configs (streamed with ijson).
+
+    Args:
+        json_path (str): Path of the results JSON
+
+    Returns:
+        dict: Results JSON, the glitch_configs have no "results" entry
+    """
+    def skip_results(events):
+        for prefix, event, value in events:
+            if prefix.startswith("glitch_configs.item.results"):
+                continue
+            if prefix == "glitch_configs.item" and event == "map_key" and value == "results":
+                continue
+            yield prefix, event, value
+
+    with open(json_path, 'rb') as f:
+        return next(ijson.items(skip_results(ijson.parse(f, use_float=True)), ""))
+
+def load_config_results(json_path, config_index):
+    """
+    Load the results of a single glitch_config from a results JSON (streamed with ijson).
+    Objects are only built for the requested glitch_config, the others are just tokenized.
+
+    Args:
+        json_path (str): Path of the results JSON
+        config_index (int): Index of the glitch_config
+
+    Raises:
+        IndexError: If the results JSON has no glitch_config with index config_index
+
+    Returns:
+        dict: Results of the glitch_config
+    """
+    def config_events(events):
+        index = -1
+        for prefix, event, value in events:
+            if prefix == "glitch_configs.item" and event == "start_map":
+                index += 1
+            if index == config_index:
+                yield prefix, event, value
+            elif index > config_index:
+                return
+
+    with open(json_path, 'rb') as f:
+        for results in ijson.items(config_events(ijson.parse(f, use_float=True)), "glitch_configs.item.results"):
+            return results
+    raise IndexError(f"No glitch_config {config_index} in {json_path}")
+
 class GlitchVisualizer:
-    def __init__(self, root, json_data):
+    def __init__(self, root, json_data, results_loader=None):
         self.root = root
         root.title("Glitch Visualizer")
 
         self.data = json_data
-        self.positions = self.data['positions']
+        # (N, 3) array of [x, y, z], the same for all configs
+        self.positions = np.asarray(self.data['positions'], dtype=np.float64).reshape(-1, 3)
+        self._xs = self.positions[:, 0]
+        self._ys = self.positions[:, 1]
         self.glitch_configs = self.data['glitch_configs']
         self.num_configs = len(self.glitch_configs)
+        # Results of the glitch_configs are accessed with _config_results(config_index).
+        # results_loader(config_index) loads them on demand if they are not part of json_data (see load_config_results()),
+        # the last few are kept for switching back and forth between configs.
+        if results_loader is None:
+            results_loader = lambda config_index: self.glitch_configs[config_index]['results']
+        self._config_results = functools.lru_cache(maxsize=3)(results_loader)
         self.current_config_index = 0
         self.current_point_index = 0
 
         self.last_clicked_index = None
         self._first_plot_update = True
+        self._extradata_index = {} # result_type -> {position_index: [data, ...]} for the current config
 
         # Configure grid weights for resizing
         # root.grid_columnconfigure(0, weight=3)  # Left plot
@@ -139,6 +342,10 @@ class GlitchVisualizer:
         self.point_tree.heading("Value", text="Value")
         self.point_tree.pack(fill="both", expand=True, padx=1, pady=1)
 
+        # Children of dict/list nodes are only inserted when the node is opened
+        self._deferred = {} # item id -> (value, tag) of not yet expanded nodes
+        self.point_tree.bind("<<TreeviewOpen>>", self._expand_node)
+
         # Initialize with empty data
         self.clear_point_details()
 
@@ -207,15 +414,27 @@ class GlitchVisualizer:
 
     def update_glitch_config_display(self):
         """Update both plot and sidebar when config changes"""
+        self._index_extradata()
         self.update_glitch_params_sidebar()
         self.update_point_details_sidebar()
         self.update_plot()
 
+    def _index_extradata(self):
+        """Group the extradata of the current config by position_index (so clicking a point doesn't scan all of it)"""
+        results = self._config_results(self.current_config_index)
+
+        self._extradata_index = {}
+        for result_type, result in results.items():
+            if result_type.startswith("num_"):
+                continue
+            index = self._extradata_index[result_type] = {}
+            for extradata in result:
+                index.setdefault(extradata["position_index"], []).append(extradata["data"])
+
     def update_glitch_params_sidebar(self):
         """Update the sidebar with current config parameters"""
         # Clear existing rows
-        for row in self.param_tree.get_children():
-            self.param_tree.delete(row)
+        self.param_tree.delete(*self.param_tree.get_children())
 
         # Get current config
         config = self.glitch_configs[self.current_config_index]
@@ -225,44 +444,12 @@ class GlitchVisualizer:
             if param != 'results':  # Skip the results data
                 self.param_tree.insert("", "end", values=(param, value))
 
-    def update_plot(self):
-        """Update the plot with current config data"""
-        self.ax.clear()
-
-        config = self.glitch_configs[self.current_config_index]
-        results = config['results']
-
-        # Get x,y positions
-        self.positions_xy = [(x, y) for x, y, _ in self.positions]
-        xs = [pos[0] for pos in self.positions]
-        ys = [pos[1] for pos in self.positions]
-
-        # Color points based on results
-        colors_list = [
-            classify_color(
-                results["num_nofaults"][i],
-                results["num_faults"][i],
-                results["num_crashes"][i],
-                results["num_resets"][i],
-                results["num_soft_bricked"][i] if "num_soft_bricked" in results else 0,
-                results["num_hard_bricked"][i] if "num_hard_bricked" in results else 0,
-                results["num_skipped"][i]      if "num_skipped" in results else 0,
-            ) for i in range(len(self.positions_xy))
-        ]
-
-        # Highlight points where exeutions were skipped with pink perimeter
-        if "num_skipped" in results:
-            edgecolors_list = [
-                ("#F80BD8" if num_skipped > 0 else "black") for num_skipped in results["num_skipped"]
-            ]
-        else:
-            edgecolors_list = "black"
-
-        # Create scatter plot
-        self.scat = self.ax.scatter(xs, ys, c=colors_list, s=120, linewidths=2, edgecolors=edgecolors_list)
+    def _build_plot(self):
+        """Create the scatter plot once (positions, labels and legend are the same for all configs)"""
+        # Create scatter plot (colors are set by update_plot())
+        self.scat = self.ax.scatter(self._xs, self._ys, s=120, linewidths=2, edgecolors="black")
         self.ax.set_xlabel("X")
         self.ax.set_ylabel("Y")
-        self.ax.set_title(f"Fault Injection Point Matrix (Config {self.current_config_index})")
         self.ax.set_aspect('equal', 'box')
         self.ax.invert_yaxis()
 
@@ -283,46 +470,95 @@ class GlitchVisualizer:
             borderaxespad=0.5
         )
 
-        # Connect click event
+        # Connect click event (only once, every mpl_connect adds another callback)
         self.canvas.mpl_connect('pick_event', self.on_point_click)
         self.scat.set_picker(True)  # Enable picking on the scatter plot
 
+        # Points and title are the only parts that change between configs: they are drawn on top of
+        # a saved background (blitting) instead of redrawing the whole figure
+        self.scat.set_animated(True)
+        self.ax.title.set_animated(True)
+        self._plot_background = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('resize_event', self._on_resize)
+
+    def _on_draw(self, event):
+        """Save the background after every full redraw and draw the animated artists onto it"""
+        self._plot_background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _on_resize(self, event):
+        # Saved background has the old size until the next full redraw
+        self._plot_background = None
+
+    def _draw_animated(self):
+        self.fig.draw_artist(self.scat)
+        self.fig.draw_artist(self.ax.title)
+
+    def update_plot(self):
+        """Update the plot with current config data (only colors and title change between configs)"""
+        if self._first_plot_update:
+            self._build_plot()
+
+        results = self._config_results(self.current_config_index)
+
+        # Color points based on results
+        colors_rgb = classify_colors(results, len(self.positions))
+
+        # Highlight points where exeutions were skipped with pink perimeter
+        if "num_skipped" in results:
+            skipped = np.asarray(results["num_skipped"]) > 0
+            edgecolors_rgb = _EDGE_COLORS_TABLE[skipped.astype(np.intp)]
+        else:
+            edgecolors_rgb = "black"
+
+        self.scat.set_facecolors(colors_rgb)
+        self.scat.set_edgecolors(edgecolors_rgb)
+        self.ax.set_title(f"Fault Injection Point Matrix (Config {self.current_config_index})")
+
+        if not self._first_plot_update:
+            if self._plot_background is None:
+                # No full redraw yet (or resized), the draw_event saves a new background
+                self.canvas.draw_idle()
+            else:
+                self.canvas.restore_region(self._plot_background)
+                self._draw_animated()
+                self.canvas.blit(self.fig.bbox)
+            return
 
         # Critical steps to make Tkinter respect the new layout:
         # 1. First draw the canvas to calculate sizes
         self.canvas.draw()
 
-        if self._first_plot_update:
-            # 2. Adjust the figure size to include legend space
-            fig_width, fig_height = self.fig.get_size_inches()
-            legend_height = 0.4  # Inches to allocate for legend
-            self.fig.set_size_inches(fig_width, fig_height + legend_height)
+        # 2. Adjust the figure size to include legend space
+        fig_width, fig_height = self.fig.get_size_inches()
+        legend_height = 0.4  # Inches to allocate for legend
+        self.fig.set_size_inches(fig_width, fig_height + legend_height)
 
-            # 3. Adjust subplot parameters to make room
-            self.fig.subplots_adjust(bottom=0.25)  # Increase bottom margin
+        # 3. Adjust subplot parameters to make room
+        self.fig.subplots_adjust(bottom=0.25)  # Increase bottom margin
 
-            # 4. Force Tkinter to recalculate layout
-            self.canvas.get_tk_widget().update_idletasks()
-            self.root.update_idletasks()
+        # 4. Force Tkinter to recalculate layout
+        self.canvas.get_tk_widget().update_idletasks()
+        self.root.update_idletasks()
 
-            # 5. Redraw everything
-            self.canvas.draw_idle()
-            self._first_plot_update = False
+        # 5. Redraw everything
+        self.canvas.draw_idle()
+        self._first_plot_update = False
 
     def clear_point_details(self):
         """Clear the point details table"""
-        for row in self.point_tree.get_children():
-            self.point_tree.delete(row)
+        self.point_tree.delete(*self.point_tree.get_children())
+        self._deferred.clear()
         self.point_tree.insert("", "end", text="No point", values=("selected"))
 
     def update_point_details_sidebar(self):
         """Update the point details table with information for the given point"""
         # Clear existing rows
-        for row in self.point_tree.get_children():
-            self.point_tree.delete(row)
+        self.point_tree.delete(*self.point_tree.get_children())
+        self._deferred.clear()
 
-        config = self.glitch_configs[self.current_config_index]
-        results = config['results']
+        results = self._config_results(self.current_config_index)
         position = self.positions[self.current_point_index]
 
         # Insert point position:
@@ -333,7 +569,7 @@ class GlitchVisualizer:
             if result_type.startswith("num_"):
                 self._insert_point_param("", result_type, result[self.current_point_index])
             else:
-                extradata = [extradata["data"] for extradata in result if extradata["position_index"] == self.current_point_index]
+                extradata = self._extradata_index[result_type].get(self.current_point_index, [])
                 if len(extradata) == 1:
                     extradata = extradata[0]
                 self._insert_point_param("", result_type, extradata)
@@ -343,27 +579,58 @@ class GlitchVisualizer:
 
     def _insert_point_param(self, parent, key, value, tag=None):
         """
-        Recursively insert a key/value into the Treeview.
-        If value is a dict, create child items for each key.
-        If value is a list, create child items for each element.
+        Insert a key/value into the Treeview.
+        If value is a dict or list, create a node whose children (one per key/element) are inserted
+        when the node is opened (top level nodes are opened right away).
         Otherwise, insert as a leaf node.
         """
+        tags = (tag,) if tag else ()
         if isinstance(value, dict):
             # Parent node for this dict
-            node = self.point_tree.insert(parent, "end", text=str(key), values=("dict",), open=True, tags=(tag,) if tag else ())
-            for k, v in value.items():
-                self._insert_point_param(node, k, v, tag=tag)
+            node = self._point_tree_insert(parent, str(key), ("dict",), tags)
         elif isinstance(value, list):
             # Parent node for list
-            node = self.point_tree.insert(parent, "end", text=str(key), values=(f"list[{len(value)}]",), open=True, tags=(tag,) if tag else ())
-            for i, item in enumerate(value):
-                self._insert_point_param(node, f"{i+1}", item, tag=tag)
+            node = self._point_tree_insert(parent, str(key), (f"list[{len(value)}]",), tags)
         else:
             # Leaf node
-            node = self.point_tree.insert(parent, "end", text=str(key), values=(str(value),), tags=(tag,) if tag else ())
+            return self._point_tree_insert(parent, str(key), (str(value),), tags)
+
+        if value:
+            if parent == "":
+                self._insert_children(node, value, tag)
+                self.point_tree.item(node, open=True)
+            else:
+                # Placeholder child, so the node can be opened
+                self._point_tree_insert(node, "…", (), ())
+                self._deferred[node] = (value, tag)
 
         return node
 
+    def _point_tree_insert(self, parent, text, values, tags):
+        """
+        Append a row to the point details table. Calls the Tcl insert command directly,
+        ttk.Treeview.insert() formats its keyword options in Python on every call.
+        """
+        tree = self.point_tree
+        return tree.tk.call(tree._w, "insert", parent, "end", "-text", text, "-values", values, "-tags", tags)
+
+    def _insert_children(self, node, value, tag):
+        """Insert child items for each key (dict) or element (list) of value"""
+        items = value.items() if isinstance(value, dict) else ((f"{i+1}", item) for i, item in enumerate(value))
+        for k, v in items:
+            self._insert_point_param(node, k, v, tag=tag)
+
+    def _expand_node(self, event):
+        """Insert the children of a node when it is opened for the first time"""
+        node = self.point_tree.focus()
+        if node not in self._deferred:
+            return
+        value, tag = self._deferred.pop(node)
+
+        # Replace placeholder with the actual children
+        self.point_tree.delete(*self.point_tree.get_children(node))
+        self._insert_children(node, value, tag)
+
 
     def copy_fault_data(self, event):
         """Copy selected fault data to clipboard"""
@@ -397,8 +664,15 @@ def main():
     if len(sys.argv) > 1:
         json_path = sys.argv[1]
 
-    with open(json_path, 'r') as f:
-        data = json.load(f)
+    results_loader = None
+    if ijson is not None and os.path.getsize(json_path) >= LAZY_LOAD_MIN_SIZE:
+        # Only keep the results of the shown glitch_configs in memory
+        data = load_results_headers(json_path)
+        results_loader = functools.partial(load_config_results, json_path)
+    else:
+        # orjson parses large result files (per-point fault data) several times faster than json
+        with open(json_path, 'rb') as f:
+            data = orjson.loads(f.read()) if orjson is not None else json.load(f)
 
     root = tk.Tk()
     # root.attributes("-fullscreen", True)  # substitute `Tk` for whatever your `Tk()` object is called
@@ -419,7 +693,7 @@ def main():
     signal.signal(signal.SIGINT, sigint_handler)
 
     # Display GlitchVisualizer App
-    app = GlitchVisualizer(root, data)
+    app = GlitchVisualizer(root, data, results_loader)
 
     try:
         root.mainloop()